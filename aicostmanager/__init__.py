@@ -1,39 +1,118 @@
 """Python SDK for the AICostManager API."""
 
+# This file is generated by scripts/generate_init.py from _exports.toml.
+# Edit the manifest and regenerate instead of changing it by hand.
+
+from __future__ import annotations
+
+import importlib
+import os
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.41"
 
-from .client import (
-    AICMError,
-    APIRequestError,
-    AsyncCostManagerClient,
-    BatchSizeLimitExceeded,
-    CostManagerClient,
-    MissingConfiguration,
-    NoCostsTrackedException,
-    UsageLimitExceeded,
-)
-from .config_manager import ConfigManager
-from .costs import CostQueryManager
-from .delivery import (
-    Delivery,
-    DeliveryConfig,
-    DeliveryType,
-    ImmediateDelivery,
-    PersistentDelivery,
-    PersistentQueueManager,
-    create_delivery,
-)
-from .limits import BaseLimitManager, TriggeredLimitManager, UsageLimitManager
-from .tracker import Tracker
-from .wrappers import (
-    AnthropicWrapper,
-    BedrockWrapper,
-    FireworksWrapper,
-    GeminiWrapper,
-    OpenAIChatWrapper,
-    OpenAIResponsesWrapper,
+# Public names are resolved lazily (PEP 562) so ``import aicostmanager`` does
+# not pay for httpx, tenacity, pydantic models or JWT handling until a class
+# is actually used.
+_LAZY: dict[str, str] = {
+    "AICMError": ".client",
+    "APIRequestError": ".client",
+    "AsyncCostManagerClient": ".client",
+    "BatchSizeLimitExceeded": ".client",
+    "CostManagerClient": ".client",
+    "MissingConfiguration": ".client",
+    "UsageLimitExceeded": ".client",
+    "NoCostsTrackedException": ".client",
+    "ConfigManager": ".config_manager",
+    "Delivery": ".delivery",
+    "DeliveryType": ".delivery",
+    "create_delivery": ".delivery",
+    "DeliveryConfig": ".delivery",
+    "ImmediateDelivery": ".delivery",
+    "PersistentDelivery": ".delivery",
+    "PersistentQueueManager": ".delivery",
+    "Tracker": ".tracker",
+    "BaseLimitManager": ".limits",
+    "TriggeredLimitManager": ".limits",
+    "UsageLimitManager": ".limits",
+    "OpenAIChatWrapper": ".wrappers",
+    "OpenAIResponsesWrapper": ".wrappers",
+    "AnthropicWrapper": ".wrappers",
+    "GeminiWrapper": ".wrappers",
+    "BedrockWrapper": ".wrappers",
+    "FireworksWrapper": ".wrappers",
+    "CostQueryManager": ".costs",
+}
+
+# Submodules that were implicitly available as attributes when the package
+# imported everything eagerly.
+_SUBMODULES = frozenset(
+    {
+        "client",
+        "config_manager",
+        "costs",
+        "delivery",
+        "ini_manager",
+        "limits",
+        "logger",
+        "models",
+        "tracker",
+        "triggered_limits_cache",
+        "type_validator",
+        "usage_utils",
+        "wrappers",
+    }
 )
 
+if TYPE_CHECKING:
+    from .client import (
+        AICMError,
+        APIRequestError,
+        AsyncCostManagerClient,
+        BatchSizeLimitExceeded,
+        CostManagerClient,
+        MissingConfiguration,
+        NoCostsTrackedException,
+        UsageLimitExceeded,
+    )
+    from .config_manager import ConfigManager
+    from .costs import CostQueryManager
+    from .delivery import (
+        Delivery,
+        DeliveryConfig,
+        DeliveryType,
+        ImmediateDelivery,
+        PersistentDelivery,
+        PersistentQueueManager,
+        create_delivery,
+    )
+    from .limits import BaseLimitManager, TriggeredLimitManager, UsageLimitManager
+    from .tracker import Tracker
+    from .wrappers import (
+        AnthropicWrapper,
+        BedrockWrapper,
+        FireworksWrapper,
+        GeminiWrapper,
+        OpenAIChatWrapper,
+        OpenAIResponsesWrapper,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY.get(name)
+    if module_path is not None:
+        value = getattr(importlib.import_module(module_path, __name__), name)
+        globals()[name] = value
+        return value
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
 __all__ = [
     "AICMError",
     "APIRequestError",
@@ -64,3 +143,10 @@ __all__ = [
     "CostQueryManager",
     "__version__",
 ]
+
+# Resolve every export up front when requested (useful in CI to surface broken
+# imports that lazy loading would otherwise hide until first use).
+if os.getenv("AICM_EAGER_IMPORT", "").lower() in {"1", "true", "yes", "on"}:
+    for _name in _LAZY:
+        __getattr__(_name)
+    del _name
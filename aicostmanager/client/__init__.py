@@ -1,6 +1,9 @@
 """Client package exposing sync and async variants."""
 
-from .async_client import AsyncCostManagerClient
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from .exceptions import (
     AICMError,
     APIRequestError,
@@ -11,6 +14,20 @@ from .exceptions import (
 )
 from .sync_client import CostManagerClient
 
+if TYPE_CHECKING:
+    from .async_client import AsyncCostManagerClient
+
+
+def __getattr__(name: str) -> Any:
+    # The async client pulls in httpx; only import it when it is used
+    if name == "AsyncCostManagerClient":
+        from .async_client import AsyncCostManagerClient
+
+        globals()[name] = AsyncCostManagerClient
+        return AsyncCostManagerClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "AICMError",
     "APIRequestError",
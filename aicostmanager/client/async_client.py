@@ -1,8 +1,22 @@
 from __future__ import annotations
 
-from typing import Any, AsyncIterator, Dict, Iterable, Optional
+import asyncio
+import copy
+import importlib.util
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+)
 
 import httpx
+from pydantic import TypeAdapter
 
 from ..models import (
     ApiCostEventOut,
@@ -48,13 +62,33 @@ from ..models import (
     WebhookEndpointsResponse,
     WebhookEndpointUpdate,
 )
-from .base import BaseClient
+from .base import (
+    _M,
+    BaseClient,
+    _coerce_list,
+    _coerce_list_json,
+    _copy_models,
+    _filter_params,
+)
+from ..utils.json_utils import loads
 from .exceptions import APIRequestError
 
 
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Page validators built once at import rather than resolving the generic
+# alias on every ``*_typed`` call.
+_EVENTS_PAGE = TypeAdapter(PaginatedResponse[UsageEvent])
+_ROLLUPS_PAGE = TypeAdapter(PaginatedResponse[UsageRollup])
+_CUSTOMERS_PAGE = TypeAdapter(PaginatedResponse[CustomerOut])
+_REPORTS_PAGE = TypeAdapter(PaginatedResponse[GeneratedReportOut])
+
+
 class AsyncCostManagerClient(BaseClient):
     """Asynchronous variant of :class:`CostManagerClient`."""
 
+    _body_arg = "content"
+
     def __init__(
         self,
         *,
@@ -65,6 +99,8 @@ class AsyncCostManagerClient(BaseClient):
         session: Optional[httpx.AsyncClient] = None,
         proxies: Optional[dict[str, str]] = None,
         headers: Optional[dict[str, str]] = None,
+        max_connections: int = 64,
+        max_keepalive_connections: int = 32,
     ) -> None:
         super().__init__(
             aicm_api_key=aicm_api_key,
@@ -76,16 +112,19 @@ class AsyncCostManagerClient(BaseClient):
             proxy = None
             if proxies:
                 proxy = next(iter(proxies.values()))
-            session = httpx.AsyncClient(proxy=proxy)
-        self.session = session
-        self.session.headers.update(
-            {
-                "Authorization": f"Bearer {self.api_key}",
-                "User-Agent": "aicostmanager-python",
-            }
-        )
-        if headers:
-            self.session.headers.update(headers)
+            # Concurrent calls share pooled connections, multiplexed over
+            # HTTP/2 when ``h2`` is installed (``pip install httpx[http2]``).
+            session = httpx.AsyncClient(
+                proxy=proxy,
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=30.0,
+                ),
+                timeout=httpx.Timeout(10.0, connect=5.0),
+            )
+        self._init_session(session, headers)
 
     async def close(self) -> None:
         await self.session.aclose()
@@ -96,32 +135,114 @@ class AsyncCostManagerClient(BaseClient):
     async def __aexit__(self, exc_type, exc, tb) -> None:
         await self.close()
 
-    async def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+    async def _send(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
         url = path if path.startswith("http") else self.api_root + path
-        resp = await self.session.request(method, url, **kwargs)
-        if not resp.status_code or not (200 <= resp.status_code < 300):
+        return self._check(await self.session.request(method, url, **kwargs))
+
+    @staticmethod
+    def _check(resp: httpx.Response) -> httpx.Response:
+        """Raise :class:`APIRequestError` unless ``resp`` is a success."""
+        if not 200 <= resp.status_code < 300:
             try:
-                detail = resp.json()
+                detail = loads(resp.content)
             except Exception:
                 detail = resp.text
             raise APIRequestError(resp.status_code, detail)
+        return resp
+
+    async def _request_cached(
+        self,
+        path: str,
+        build: Callable[[Any], Any],
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        clone: Callable[[Any], Any] = copy.deepcopy,
+    ) -> Any:
+        """GET ``path`` conditionally, reusing ``build``'s result on ``304``.
+
+        Meant for catalog endpoints that rarely change. When the server
+        sends an ``ETag`` the built result is kept, and later calls send
+        ``If-None-Match`` so an unchanged response skips parsing and
+        validation. Each call returns ``clone`` of the cached value (a deep
+        copy by default) so callers never share or mutate the cached object.
+        Only the most recently used results are kept.
+        """
+        key = self._etag_key(path, params)
+        cached = self._etag_entry(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        url = self.api_root + path
+        resp = await self.session.request("GET", url, params=params, headers=headers)
+        if cached and resp.status_code == 304:
+            return clone(cached[1])
+        resp = self._check(resp)
+        value = build(loads(resp.content))
+        etag = resp.headers.get("ETag")
+        if etag:
+            self._remember_etag(key, etag, value)
+        return clone(value)
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+        resp = await self._send(method, path, **kwargs)
         if resp.status_code == 204:
             return None
-        return resp.json()
+        return loads(resp.content)
 
-    async def _iter_paginated(self, path: str, **params: Any) -> AsyncIterator[dict]:
+    async def _request_model(
+        self, model: Type[_M], method: str, path: str, **kwargs: Any
+    ) -> _M:
+        # Validate straight from the body bytes; skips the intermediate dict
+        resp = await self._send(method, path, **kwargs)
+        return model.model_validate_json(resp.content)
+
+    async def _request_adapter(
+        self, adapter: TypeAdapter, method: str, path: str, **kwargs: Any
+    ) -> Any:
+        resp = await self._send(method, path, **kwargs)
+        return adapter.validate_json(resp.content)
+
+    async def _request_list(
+        self, model: Type[_M], method: str, path: str, **kwargs: Any
+    ) -> List[_M]:
+        resp = await self._send(method, path, **kwargs)
+        return _coerce_list_json(model, resp.content)
+
+    async def _iter_pages(
+        self, path: str, **params: Any
+    ) -> AsyncIterator[List[dict]]:
+        """Yield the ``results`` list of each page in turn."""
+        root = self.api_root
+        root_len = len(root)
+        data = await self._request("GET", path, params=params)
         while True:
-            data = await self._request("GET", path, params=params)
-            for item in data.get("results", []):
-                yield item
+            # Fetch the next page while the caller consumes this one
+            next_task: Optional[asyncio.Task] = None
             next_url = data.get("next")
-            if not next_url:
+            if next_url:
+                path = next_url[root_len:] if next_url.startswith(root) else next_url
+                next_task = asyncio.create_task(self._request("GET", path, params={}))
+            try:
+                yield data.get("results", [])
+            except BaseException:
+                # The caller stopped early (aclose/cancel); drop the prefetch
+                if next_task is not None:
+                    next_task.cancel()
+                raise
+            if next_task is None:
                 break
-            if next_url.startswith(self.api_root):
-                path = next_url[len(self.api_root) :]
-            else:
-                path = next_url
-            params = {}
+            data = await next_task
+
+    async def _iter_paginated(self, path: str, **params: Any) -> AsyncIterator[dict]:
+        async for results in self._iter_pages(path, **params):
+            for item in results:
+                yield item
+
+    async def _iter_models(
+        self, cls: Type[_M], path: str, **params: Any
+    ) -> AsyncIterator[_M]:
+        async for results in self._iter_pages(path, **params):
+            # One validator call per page rather than per item
+            for model in _coerce_list(cls, results):
+                yield model
 
     async def get_triggered_limits(self) -> Dict[str, Any]:
         """Asynchronously fetch triggered limit information."""
@@ -133,10 +254,7 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return await self._request("GET", "/usage/events/", params=params)
 
     async def list_usage_events_typed(
@@ -145,8 +263,11 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> PaginatedResponse[UsageEvent]:
         """Typed variant of :meth:`list_usage_events`."""
-        data = await self.list_usage_events(filters, **params)
-        return PaginatedResponse[UsageEvent].model_validate(data)
+        if filters:
+            params.update(_filter_params(filters))
+        return await self._request_adapter(
+            _EVENTS_PAGE, "GET", "/usage/events/", params=params
+        )
 
     async def iter_usage_events(
         self,
@@ -154,16 +275,12 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> AsyncIterator[UsageEvent]:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
-        async for item in self._iter_paginated("/usage/events/", **params):
-            yield UsageEvent.model_validate(item)
+            params.update(_filter_params(filters))
+        async for item in self._iter_models(UsageEvent, "/usage/events/", **params):
+            yield item
 
     async def get_usage_event(self, event_id: str) -> UsageEvent:
-        data = await self._request("GET", f"/usage/event/{event_id}/")
-        return UsageEvent.model_validate(data)
+        return await self._request_model(UsageEvent, "GET", f"/usage/event/{event_id}/")
 
     async def list_usage_rollups(
         self,
@@ -171,10 +288,7 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return await self._request("GET", "/usage/rollups/", params=params)
 
     async def list_usage_rollups_typed(
@@ -183,8 +297,11 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> PaginatedResponse[UsageRollup]:
         """Typed variant of :meth:`list_usage_rollups`."""
-        data = await self.list_usage_rollups(filters, **params)
-        return PaginatedResponse[UsageRollup].model_validate(data)
+        if filters:
+            params.update(_filter_params(filters))
+        return await self._request_adapter(
+            _ROLLUPS_PAGE, "GET", "/usage/rollups/", params=params
+        )
 
     async def iter_usage_rollups(
         self,
@@ -192,12 +309,9 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> AsyncIterator[UsageRollup]:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
-        async for item in self._iter_paginated("/usage/rollups/", **params):
-            yield UsageRollup.model_validate(item)
+            params.update(_filter_params(filters))
+        async for item in self._iter_models(UsageRollup, "/usage/rollups/", **params):
+            yield item
 
     async def list_customers(
         self,
@@ -205,10 +319,7 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return await self._request("GET", "/customers/", params=params)
 
     async def list_customers_typed(
@@ -217,88 +328,103 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> PaginatedResponse[CustomerOut]:
         """Typed variant of :meth:`list_customers`."""
-        data = await self.list_customers(filters, **params)
-        return PaginatedResponse[CustomerOut].model_validate(data)
+        if filters:
+            params.update(_filter_params(filters))
+        return await self._request_adapter(
+            _CUSTOMERS_PAGE, "GET", "/customers/", params=params
+        )
 
     async def iter_customers(self, **params: Any) -> AsyncIterator[CustomerOut]:
-        async for item in self._iter_paginated("/customers/", **params):
-            yield CustomerOut.model_validate(item)
+        async for item in self._iter_models(CustomerOut, "/customers/", **params):
+            yield item
 
     async def create_customer(self, data: CustomerIn | Dict[str, Any]) -> CustomerOut:
-        payload = data.model_dump(mode="json") if isinstance(data, CustomerIn) else data
-        resp = await self._request("POST", "/customers/", json=payload)
-        return CustomerOut.model_validate(resp)
+        return await self._request_model(
+            CustomerOut, "POST", "/customers/", **self._json_kwargs(data, CustomerIn)
+        )
 
     async def get_customer(self, customer_id: str) -> CustomerOut:
-        data = await self._request("GET", f"/customers/{customer_id}/")
-        return CustomerOut.model_validate(data)
+        return await self._request_model(
+            CustomerOut, "GET", f"/customers/{customer_id}/"
+        )
 
     async def update_customer(
         self, customer_id: str, data: CustomerIn | Dict[str, Any]
     ) -> CustomerOut:
-        payload = data.model_dump(mode="json") if isinstance(data, CustomerIn) else data
-        resp = await self._request("PUT", f"/customers/{customer_id}/", json=payload)
-        return CustomerOut.model_validate(resp)
+        return await self._request_model(
+            CustomerOut,
+            "PUT",
+            f"/customers/{customer_id}/",
+            **self._json_kwargs(data, CustomerIn),
+        )
 
     async def delete_customer(self, customer_id: str) -> None:
         await self._request("DELETE", f"/customers/{customer_id}/")
         return None
 
     async def list_usage_limits(self) -> Iterable[UsageLimitOut]:
-        data = await self._request("GET", "/usage-limits/")
-        return [UsageLimitOut.model_validate(i) for i in data]
+        return await self._request_list(UsageLimitOut, "GET", "/usage-limits/")
 
     async def create_usage_limit(
         self, data: UsageLimitIn | Dict[str, Any]
     ) -> UsageLimitOut:
-        payload = (
-            data.model_dump(mode="json") if isinstance(data, UsageLimitIn) else data
+        return await self._request_model(
+            UsageLimitOut,
+            "POST",
+            "/usage-limits/",
+            **self._json_kwargs(data, UsageLimitIn),
         )
-        resp = await self._request("POST", "/usage-limits/", json=payload)
-        return UsageLimitOut.model_validate(resp)
 
     async def get_usage_limit(self, limit_id: str) -> UsageLimitOut:
-        data = await self._request("GET", f"/usage-limits/{limit_id}/")
-        return UsageLimitOut.model_validate(data)
+        return await self._request_model(
+            UsageLimitOut, "GET", f"/usage-limits/{limit_id}/"
+        )
 
     async def update_usage_limit(
         self, limit_id: str, data: UsageLimitIn | Dict[str, Any]
     ) -> UsageLimitOut:
-        payload = (
-            data.model_dump(mode="json") if isinstance(data, UsageLimitIn) else data
+        return await self._request_model(
+            UsageLimitOut,
+            "PUT",
+            f"/usage-limits/{limit_id}/",
+            **self._json_kwargs(data, UsageLimitIn),
         )
-        resp = await self._request("PUT", f"/usage-limits/{limit_id}/", json=payload)
-        return UsageLimitOut.model_validate(resp)
 
     async def delete_usage_limit(self, limit_id: str) -> None:
         await self._request("DELETE", f"/usage-limits/{limit_id}/")
         return None
 
     async def list_usage_limit_progress(self) -> Iterable[UsageLimitProgressOut]:
-        data = await self._request("GET", "/usage-limits/progress/")
-        return [UsageLimitProgressOut.model_validate(i) for i in data]
+        return await self._request_list(
+            UsageLimitProgressOut, "GET", "/usage-limits/progress/"
+        )
 
     async def list_vendors(self) -> Iterable[VendorOut]:
-        data = await self._request("GET", "/vendors/")
-        return [VendorOut.model_validate(i) for i in data]
+        return await self._request_cached(
+            "/vendors/",
+            partial(_coerce_list, VendorOut),
+            clone=_copy_models,
+        )
 
     async def list_vendor_services(self, vendor: str) -> Iterable[ServiceOut]:
-        data = await self._request("GET", "/services/", params={"vendor": vendor})
-        # Add vendor field to each service object since the API doesn't include it
-        for service in data:
-            service["vendor"] = vendor
-        return [ServiceOut.model_validate(i) for i in data]
+        def build(data: Any) -> List[ServiceOut]:
+            # Add vendor field to each service object since the API doesn't include it
+            return _coerce_list(ServiceOut, [{**i, "vendor": vendor} for i in data])
+
+        return await self._request_cached(
+            "/services/", build, params={"vendor": vendor}, clone=_copy_models
+        )
 
     async def list_service_costs(
         self, vendor: str, service: str
     ) -> Iterable[CostUnitOut]:
         """Asynchronously list cost units for a service."""
-        data = await self._request(
-            "GET",
+        return await self._request_cached(
             "/service-costs/",
+            partial(_coerce_list, CostUnitOut),
             params={"vendor": vendor, "service": service},
+            clone=_copy_models,
         )
-        return [CostUnitOut.model_validate(i) for i in data]
 
     async def list_limit_events(
         self, limit_id: Optional[str] = None, **params: Any
@@ -307,8 +433,9 @@ class AsyncCostManagerClient(BaseClient):
         params = {k: v for k, v in params.items() if v is not None}
         if limit_id is not None:
             params["limit_id"] = limit_id
-        data = await self._request("GET", "/limit-events/", params=params)
-        return [LimitEventOut.model_validate(i) for i in data]
+        return await self._request_list(
+            LimitEventOut, "GET", "/limit-events/", params=params
+        )
 
     # Analytics methods
     async def analytics_costs_daily(
@@ -317,10 +444,7 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return await self._request("GET", "/analytics/costs/daily", params=params)
 
     async def analytics_costs_monthly(
@@ -329,10 +453,7 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return await self._request("GET", "/analytics/costs/monthly", params=params)
 
     async def analytics_costs_snapshots(
@@ -341,12 +462,10 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> SnapshotsResponseSchema:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
-        data = await self._request("GET", "/analytics/costs/snapshots", params=params)
-        return SnapshotsResponseSchema.model_validate(data)
+            params.update(_filter_params(filters))
+        return await self._request_model(
+            SnapshotsResponseSchema, "GET", "/analytics/costs/snapshots", params=params
+        )
 
     async def analytics_costs_trends(
         self,
@@ -354,12 +473,10 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> TrendsResponseSchema:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
-        data = await self._request("GET", "/analytics/costs/trends", params=params)
-        return TrendsResponseSchema.model_validate(data)
+            params.update(_filter_params(filters))
+        return await self._request_model(
+            TrendsResponseSchema, "GET", "/analytics/costs/trends", params=params
+        )
 
     async def analytics_costs_peak_usage(
         self,
@@ -367,10 +484,7 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return await self._request("GET", "/analytics/costs/peak-usage", params=params)
 
     async def analytics_customers_costs(
@@ -379,12 +493,10 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> List[CustomerBreakdownSchema]:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
-        data = await self._request("GET", "/analytics/customers/costs", params=params)
-        return [CustomerBreakdownSchema.model_validate(i) for i in data]
+            params.update(_filter_params(filters))
+        return await self._request_list(
+            CustomerBreakdownSchema, "GET", "/analytics/customers/costs", params=params
+        )
 
     async def analytics_services_ranking(
         self,
@@ -392,10 +504,7 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return await self._request("GET", "/analytics/services/ranking", params=params)
 
     async def analytics_vendors_comparison(
@@ -404,10 +513,7 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return await self._request(
             "GET", "/analytics/vendors/comparison", params=params
         )
@@ -418,10 +524,7 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return await self._request(
             "GET", "/analytics/services/efficiency", params=params
         )
@@ -432,10 +535,7 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return await self._request("GET", "/analytics/services/usage", params=params)
 
     async def analytics_vendors_usage(
@@ -444,10 +544,7 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return await self._request("GET", "/analytics/vendors/usage", params=params)
 
     async def analytics_customers_tokens(
@@ -456,23 +553,26 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> List[CustomerTokenBreakdownSchema]:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
-        data = await self._request("GET", "/analytics/customers/tokens", params=params)
-        return [CustomerTokenBreakdownSchema.model_validate(i) for i in data]
+            params.update(_filter_params(filters))
+        return await self._request_list(
+            CustomerTokenBreakdownSchema,
+            "GET",
+            "/analytics/customers/tokens",
+            params=params,
+        )
 
     # Reports methods
     async def list_reports(
         self, **params: Any
     ) -> PaginatedResponse[GeneratedReportOut]:
-        data = await self._request("GET", "/reports/", params=params)
-        return PaginatedResponse[GeneratedReportOut].model_validate(data)
+        return await self._request_adapter(
+            _REPORTS_PAGE, "GET", "/reports/", params=params
+        )
 
     async def get_report(self, report_id: str) -> GeneratedReportOut:
-        data = await self._request("GET", f"/reports/{report_id}/")
-        return GeneratedReportOut.model_validate(data)
+        return await self._request_model(
+            GeneratedReportOut, "GET", f"/reports/{report_id}/"
+        )
 
     async def download_report(self, report_id: str) -> Any:
         """Download generated report file."""
@@ -485,53 +585,52 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> CostEventsResponse:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
-        data = await self._request("GET", "/costs/", params=params)
-        return CostEventsResponse.model_validate(data)
+            params.update(_filter_params(filters))
+        return await self._request_model(
+            CostEventsResponse, "GET", "/costs/", params=params
+        )
 
     async def list_cost_events_by_response_id(
         self, response_id: str
     ) -> List[ApiCostEventOut]:
-        data = await self._request("GET", f"/cost-events/{response_id}")
-        return [ApiCostEventOut.model_validate(i) for i in data]
+        return await self._request_list(
+            ApiCostEventOut, "GET", f"/cost-events/{response_id}"
+        )
 
     # Webhook methods
     async def create_webhook_endpoint(
         self, data: WebhookEndpointCreate | Dict[str, Any]
     ) -> WebhookEndpointOut:
-        payload = (
-            data.model_dump(mode="json")
-            if isinstance(data, WebhookEndpointCreate)
-            else data
+        return await self._request_model(
+            WebhookEndpointOut,
+            "POST",
+            "/webhooks/",
+            **self._json_kwargs(data, WebhookEndpointCreate),
         )
-        resp = await self._request("POST", "/webhooks/", json=payload)
-        return WebhookEndpointOut.model_validate(resp)
 
     async def list_webhook_endpoints(
         self, active_only: bool = False, **params: Any
     ) -> WebhookEndpointsResponse:
         params = {k: v for k, v in params.items() if v is not None}
         params["active_only"] = active_only
-        data = await self._request("GET", "/webhooks/", params=params)
-        return WebhookEndpointsResponse.model_validate(data)
+        return await self._request_model(
+            WebhookEndpointsResponse, "GET", "/webhooks/", params=params
+        )
 
     async def get_webhook_endpoint(self, webhook_uuid: str) -> WebhookEndpointOut:
-        data = await self._request("GET", f"/webhooks/{webhook_uuid}/")
-        return WebhookEndpointOut.model_validate(data)
+        return await self._request_model(
+            WebhookEndpointOut, "GET", f"/webhooks/{webhook_uuid}/"
+        )
 
     async def update_webhook_endpoint(
         self, webhook_uuid: str, data: WebhookEndpointUpdate | Dict[str, Any]
     ) -> WebhookEndpointOut:
-        payload = (
-            data.model_dump(mode="json", exclude_none=True)
-            if isinstance(data, WebhookEndpointUpdate)
-            else data
+        return await self._request_model(
+            WebhookEndpointOut,
+            "PUT",
+            f"/webhooks/{webhook_uuid}/",
+            **self._json_kwargs(data, WebhookEndpointUpdate, exclude_none=True),
         )
-        resp = await self._request("PUT", f"/webhooks/{webhook_uuid}/", json=payload)
-        return WebhookEndpointOut.model_validate(resp)
 
     async def delete_webhook_endpoint(self, webhook_uuid: str) -> None:
         await self._request("DELETE", f"/webhooks/{webhook_uuid}/")
@@ -541,52 +640,53 @@ class AsyncCostManagerClient(BaseClient):
     async def create_export_schedule(
         self, data: ExportScheduleCreate | Dict[str, Any]
     ) -> ExportScheduleOut:
-        payload = (
-            data.model_dump(mode="json")
-            if isinstance(data, ExportScheduleCreate)
-            else data
+        return await self._request_model(
+            ExportScheduleOut,
+            "POST",
+            "/schedules/",
+            **self._json_kwargs(data, ExportScheduleCreate),
         )
-        resp = await self._request("POST", "/schedules/", json=payload)
-        return ExportScheduleOut.model_validate(resp)
 
     async def list_export_schedules(
         self, active_only: bool = True, **params: Any
     ) -> ExportSchedulesResponse:
         params = {k: v for k, v in params.items() if v is not None}
         params["active_only"] = active_only
-        data = await self._request("GET", "/schedules/", params=params)
-        return ExportSchedulesResponse.model_validate(data)
+        return await self._request_model(
+            ExportSchedulesResponse, "GET", "/schedules/", params=params
+        )
 
     async def get_export_schedule(self, schedule_uuid: str) -> ExportScheduleOut:
-        data = await self._request("GET", f"/schedules/{schedule_uuid}/")
-        return ExportScheduleOut.model_validate(data)
+        return await self._request_model(
+            ExportScheduleOut, "GET", f"/schedules/{schedule_uuid}/"
+        )
 
     async def update_export_schedule(
         self, schedule_uuid: str, data: ExportScheduleUpdate | Dict[str, Any]
     ) -> ExportScheduleOut:
-        payload = (
-            data.model_dump(mode="json", exclude_none=True)
-            if isinstance(data, ExportScheduleUpdate)
-            else data
+        return await self._request_model(
+            ExportScheduleOut,
+            "PUT",
+            f"/schedules/{schedule_uuid}/",
+            **self._json_kwargs(data, ExportScheduleUpdate, exclude_none=True),
         )
-        resp = await self._request("PUT", f"/schedules/{schedule_uuid}/", json=payload)
-        return ExportScheduleOut.model_validate(resp)
 
     async def delete_export_schedule(self, schedule_uuid: str) -> None:
         await self._request("DELETE", f"/schedules/{schedule_uuid}/")
         return None
 
     async def list_export_jobs(self, **params: Any) -> ExportJobsResponse:
-        data = await self._request("GET", "/jobs/", params=params)
-        return ExportJobsResponse.model_validate(data)
+        return await self._request_model(
+            ExportJobsResponse, "GET", "/jobs/", params=params
+        )
 
     async def get_export_job(self, job_uuid: str) -> ExportJobOut:
-        data = await self._request("GET", f"/jobs/{job_uuid}/")
-        return ExportJobOut.model_validate(data)
+        return await self._request_model(ExportJobOut, "GET", f"/jobs/{job_uuid}/")
 
     async def trigger_export_job(self, schedule_uuid: str) -> ExportJobTriggerResponse:
-        data = await self._request("POST", f"/schedules/{schedule_uuid}/run/")
-        return ExportJobTriggerResponse.model_validate(data)
+        return await self._request_model(
+            ExportJobTriggerResponse, "POST", f"/schedules/{schedule_uuid}/run/"
+        )
 
     # Custom services methods
     async def list_custom_services(
@@ -595,38 +695,39 @@ class AsyncCostManagerClient(BaseClient):
         **params: Any,
     ) -> List[CustomServiceSummaryOut]:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
-        data = await self._request("GET", "/custom-services/", params=params)
-        return [CustomServiceSummaryOut.model_validate(i) for i in data]
+            params.update(_filter_params(filters))
+        return await self._request_list(
+            CustomServiceSummaryOut, "GET", "/custom-services/", params=params
+        )
 
     async def create_custom_service(
         self, data: CustomServiceIn | Dict[str, Any]
     ) -> CustomServiceOut:
-        payload = (
-            data.model_dump(mode="json") if isinstance(data, CustomServiceIn) else data
+        return await self._request_model(
+            CustomServiceOut,
+            "POST",
+            "/custom-services/",
+            **self._json_kwargs(data, CustomServiceIn),
         )
-        resp = await self._request("POST", "/custom-services/", json=payload)
-        return CustomServiceOut.model_validate(resp)
 
     async def get_custom_service(self, uuid: str) -> CustomServiceOut:
-        data = await self._request("GET", f"/custom-services/{uuid}/")
-        return CustomServiceOut.model_validate(data)
+        return await self._request_model(
+            CustomServiceOut, "GET", f"/custom-services/{uuid}/"
+        )
 
     async def update_custom_service(
         self, uuid: str, data: CustomServiceIn | Dict[str, Any]
     ) -> CustomServiceOut:
-        payload = (
-            data.model_dump(mode="json") if isinstance(data, CustomServiceIn) else data
+        return await self._request_model(
+            CustomServiceOut,
+            "PUT",
+            f"/custom-services/{uuid}/",
+            **self._json_kwargs(data, CustomServiceIn),
         )
-        resp = await self._request("PUT", f"/custom-services/{uuid}/", json=payload)
-        return CustomServiceOut.model_validate(resp)
 
     async def delete_custom_service(self, uuid: str) -> None:
         await self._request("DELETE", f"/custom-services/{uuid}/")
         return None
 
     async def get_openapi_schema(self) -> Any:
-        return await self._request("GET", "/openapi.json")
+        return await self._request_cached("/openapi.json", lambda data: data)
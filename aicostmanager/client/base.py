@@ -1,10 +1,81 @@
 from __future__ import annotations
 
 import os
-from typing import Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+from urllib.parse import urlencode
+
+from pydantic import BaseModel, TypeAdapter
 
 from .exceptions import MissingConfiguration
 from ..ini_manager import IniManager
+from ..utils.json_utils import dumps, loads
+
+_M = TypeVar("_M", bound=BaseModel)
+
+# Opt-in: build models from trusted list/iterator responses without
+# validation. Nested models are left as plain dicts in this mode.
+_FAST_VALIDATE = os.getenv("AICM_FAST_VALIDATE") == "1"
+
+
+def _coerce(cls: Type[_M], item: Any) -> _M:
+    """Return ``item`` as ``cls``, skipping validation when enabled."""
+    if _FAST_VALIDATE:
+        return cls.model_construct(**item)
+    return cls.model_validate(item)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(cls: Type[BaseModel]) -> TypeAdapter:
+    """Return a cached ``TypeAdapter`` validating a JSON array of ``cls``."""
+    return TypeAdapter(List[cls])
+
+
+def _coerce_list(cls: Type[_M], items: List[Any]) -> List[_M]:
+    """Return ``items`` as ``cls`` instances, validated in one call."""
+    if _FAST_VALIDATE:
+        return [cls.model_construct(**i) for i in items]
+    return _list_adapter(cls).validate_python(items)
+
+
+def _coerce_list_json(cls: Type[_M], content: bytes) -> List[_M]:
+    """Parse a JSON array response body into a list of ``cls``."""
+    if _FAST_VALIDATE:
+        return [cls.model_construct(**i) for i in loads(content)]
+    return _list_adapter(cls).validate_json(content)
+
+
+@lru_cache(maxsize=None)
+def _filter_fields(cls: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(cls.model_fields)
+
+
+def _filter_params(filters: Any) -> Dict[str, Any]:
+    """Return the non-``None`` entries of a filter model or mapping.
+
+    Filter models are flat, so their field values are read directly rather
+    than through ``model_dump``.
+    """
+    if isinstance(filters, BaseModel):
+        values = filters.__dict__
+        return {
+            k: values[k]
+            for k in _filter_fields(type(filters))
+            if values[k] is not None
+        }
+    return {k: v for k, v in filters.items() if v is not None}
+
+
+def _copy_models(items: List[_M]) -> List[_M]:
+    """Return a new list of deep model copies, for handing out cached lists."""
+    return [item.model_copy(deep=True) for item in items]
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Conditional-GET results kept per client; least recently used go first
+_ETAG_CACHE_SIZE = 64
 
 
 class BaseClient:
@@ -18,6 +89,9 @@ class BaseClient:
     4. Defaults ``https://aicostmanager.com`` and ``/api/v1``
     """
 
+    # Keyword the HTTP library takes for a pre-encoded request body
+    _body_arg = "data"
+
     def __init__(
         self,
         *,
@@ -30,6 +104,9 @@ class BaseClient:
         self.ini_path = self.ini_manager.ini_path
 
         self.api_key = aicm_api_key or os.getenv("AICM_API_KEY")
+        # ``(ETag, result)`` for conditional GETs, keyed by path and params
+        self._etag_cache: OrderedDict[str, Tuple[str, Any]] = OrderedDict()
+        self._api_root: Optional[Tuple[str, str, str]] = None
 
         def _get(option: str, default: str | None = None) -> str | None:
             val = self.ini_manager.get_option("tracker", option)
@@ -46,16 +123,68 @@ class BaseClient:
                 "API key not provided. Set AICM_API_KEY environment variable or pass aicm_api_key"
             )
 
+    def _init_session(self, session: Any, headers: Optional[Dict[str, str]]) -> None:
+        """Attach ``session`` and apply the SDK's default request headers."""
+        self.session = session
+        session.headers.update(
+            {
+                "Authorization": f"Bearer {self.api_key}",
+                "User-Agent": "aicostmanager-python",
+            }
+        )
+        if headers:
+            session.headers.update(headers)
+
     @property
     def api_root(self) -> str:
         """Return the combined AICostManager API base URL."""
-        return self.api_base.rstrip("/") + self.api_url
+        # Built on every request, so memoize it for the current base/url pair
+        cached = self._api_root
+        if cached is None or cached[0] != self.api_base or cached[1] != self.api_url:
+            root = self.api_base.rstrip("/") + self.api_url
+            cached = self._api_root = (self.api_base, self.api_url, root)
+        return cached[2]
+
+    @staticmethod
+    def _etag_key(path: str, params: Optional[Dict[str, Any]]) -> str:
+        return path + "?" + urlencode(sorted(params.items())) if params else path
+
+    def _etag_entry(self, key: str) -> Optional[Tuple[str, Any]]:
+        """Return the cached ``(ETag, result)`` for ``key`` and mark it used."""
+        cached = self._etag_cache.get(key)
+        if cached is not None:
+            self._etag_cache.move_to_end(key)
+        return cached
+
+    def _remember_etag(self, key: str, etag: str, value: Any) -> None:
+        """Cache ``value`` under ``key``, evicting the least recently used."""
+        cache = self._etag_cache
+        cache[key] = (etag, value)
+        cache.move_to_end(key)
+        if len(cache) > _ETAG_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _json_kwargs(
+        self, data: Any, model: Type[BaseModel], **dump_kwargs: Any
+    ) -> Dict[str, Any]:
+        """Return request kwargs sending ``data`` as a JSON body.
+
+        Model instances go straight through their compiled serializer to
+        bytes (``model_dump_json`` would round-trip through ``str``); plain
+        dicts are encoded with :func:`~aicostmanager.utils.json_utils.dumps`
+        (``orjson`` when installed) rather than the HTTP library's ``json=``.
+        """
+        if isinstance(data, model):
+            body = data.__pydantic_serializer__.to_json(data, **dump_kwargs)
+        else:
+            body = dumps(data)
+        return {self._body_arg: body, "headers": _JSON_HEADERS}
 
     def _store_triggered_limits(self, triggered_limits_response) -> None:
         """Persist triggered limits using the configuration manager."""
         from ..config_manager import ConfigManager
 
-        cfg_mgr = ConfigManager(ini_path=self.ini_path)
+        cfg_mgr = ConfigManager(ini_path=self.ini_path, load=False)
         if isinstance(triggered_limits_response, dict):
             tl_data = triggered_limits_response.get(
                 "triggered_limits", triggered_limits_response
@@ -5,6 +5,9 @@ from typing import Any
 from ..models import ErrorResponse
 
 
+_ERROR_RESPONSE_KEYS = frozenset(ErrorResponse.model_fields)
+
+
 class AICMError(Exception):
     """Base exception for SDK errors."""
 
@@ -23,14 +26,19 @@ class APIRequestError(AICMError):
         self.message: str | None = None
         self.details: Any | None = None
         if isinstance(detail, dict):
-            try:
-                self.error_response = ErrorResponse.model_validate(detail)
-                self.error = self.error_response.detail
-                self.message = self.error_response.detail
-                self.details = self.error_response.code
-            except Exception:
-                self.error = detail.get("detail")
-                self.message = detail.get("detail")
+            text = detail.get("detail")
+            code = detail.get("code")
+            # Check the ErrorResponse shape directly; a failed model_validate
+            # is costly and this runs for every error (e.g. while throttled).
+            if (
+                isinstance(text, str)
+                and (code is None or isinstance(code, str))
+                and detail.keys() <= _ERROR_RESPONSE_KEYS
+            ):
+                self.error_response = ErrorResponse.model_construct(**detail)
+                self.details = code
+            self.error = text
+            self.message = text
         super().__init__(f"API request failed with status {status_code}: {detail}")
 
 
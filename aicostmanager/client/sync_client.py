@@ -1,9 +1,27 @@
 from __future__ import annotations
 
+import copy
+import importlib.util
 import os
-from typing import Any, Dict, Iterable, Iterator, Optional
+import sys
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+)
 
 import requests
+from pydantic import TypeAdapter
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 from ..models import (
     ApiCostEventOut,
@@ -49,10 +67,58 @@ from ..models import (
     WebhookEndpointsResponse,
     WebhookEndpointUpdate,
 )
-from .base import BaseClient
+from .base import (
+    _M,
+    BaseClient,
+    _coerce,
+    _coerce_list,
+    _coerce_list_json,
+    _copy_models,
+    _filter_params,
+)
+from ..utils.json_utils import loads
 from .exceptions import APIRequestError
 
 
+if TYPE_CHECKING:
+    import httpx
+
+
+# Retry gateway/throttling responses for idempotent methods. POST is left
+# out so a tracked event is never submitted twice. Exhausted retries return
+# the last response so ``_request`` still raises ``APIRequestError``.
+# A keep-alive socket the server already closed fails as a read error
+# ("Connection aborted"), so connect and read errors each get one immediate
+# retry. Read retries also honour ``allowed_methods``, so POST is never
+# replayed, and the single connect retry keeps an unreachable API failing fast.
+_TRANSIENT_RETRY = Retry(
+    total=3,
+    connect=1,
+    read=1,
+    backoff_factor=0.2,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "PUT", "DELETE"}),
+    raise_on_status=False,
+)
+
+# Optional incremental JSON parser (``pip install aicostmanager[streaming]``)
+_IJSON_AVAILABLE = importlib.util.find_spec("ijson") is not None
+
+# Page validators built once at import rather than resolving the generic
+# alias on every ``*_typed`` call.
+_EVENTS_PAGE = TypeAdapter(PaginatedResponse[UsageEvent])
+_ROLLUPS_PAGE = TypeAdapter(PaginatedResponse[UsageRollup])
+_CUSTOMERS_PAGE = TypeAdapter(PaginatedResponse[CustomerOut])
+_REPORTS_PAGE = TypeAdapter(PaginatedResponse[GeneratedReportOut])
+
+
+def _is_httpx_client(session: Any) -> bool:
+    # ``session`` can only be an httpx client if httpx is already imported;
+    # checking ``sys.modules`` keeps requests-only callers from loading it.
+    httpx = sys.modules.get("httpx")
+    return httpx is not None and isinstance(session, httpx.Client)
+
+
 class CostManagerClient(BaseClient):
     """Client for AICostManager endpoints."""
 
@@ -63,9 +129,12 @@ class CostManagerClient(BaseClient):
         aicm_api_base: Optional[str] = None,
         aicm_api_url: Optional[str] = None,
         aicm_ini_path: Optional[str] = None,
-        session: Optional[requests.Session] = None,
+        session: Optional[requests.Session | httpx.Client] = None,
         proxies: Optional[dict[str, str]] = None,
         headers: Optional[dict[str, str]] = None,
+        pool_connections: int = 32,
+        pool_maxsize: int = 64,
+        stream_pages: bool = False,
     ) -> None:
         super().__init__(
             aicm_api_key=aicm_api_key,
@@ -75,27 +144,39 @@ class CostManagerClient(BaseClient):
         )
         if session is None:
             session = requests.Session()
+            # Keep enough pooled keep-alive connections for threaded callers so
+            # requests don't fall back to fresh TLS handshakes.
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=_TRANSIENT_RETRY,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            # Advertise every codec urllib3 can decode here (``br``/``zstd``
+            # when their packages are installed) rather than requests' fixed
+            # ``gzip, deflate``.
+            session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        elif _is_httpx_client(session):
+            # An httpx client brings its own pool and, with ``h2`` installed,
+            # HTTP/2 multiplexing across threads. It takes raw bodies as
+            # ``content=`` and fixes its proxies at construction time.
             if proxies:
-                setattr(session, "proxies", getattr(session, "proxies", {}))
-                session.proxies.update(proxies)
-        elif proxies:
-            setattr(session, "proxies", getattr(session, "proxies", {}))
+                raise ValueError("configure proxies on the httpx.Client itself")
+            self._body_arg = "content"
+        if proxies:
             session.proxies.update(proxies)
-        self.session = session
-        self.session.headers.update(
-            {
-                "Authorization": f"Bearer {self.api_key}",
-                "User-Agent": "aicostmanager-python",
-            }
+        self._init_session(session, headers)
+        # Incremental page parsing needs ``ijson`` and a requests session
+        self._stream_pages = (
+            stream_pages and _IJSON_AVAILABLE and isinstance(session, requests.Session)
         )
-        if headers:
-            self.session.headers.update(headers)
 
         # Initialize triggered limits during client instantiation
         self._initialize_triggered_limits()
 
     def close(self) -> None:
-        """Close the underlying requests session."""
+        """Close the underlying HTTP session."""
         self.session.close()
 
     def __enter__(self) -> "CostManagerClient":
@@ -118,33 +199,139 @@ class CostManagerClient(BaseClient):
             pass
 
     # internal helper
-    def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+    def _send(self, method: str, path: str, **kwargs: Any) -> Any:
         url = path if path.startswith("http") else self.api_root + path
-        resp = self.session.request(method, url, **kwargs)
-        if not resp.ok:
+        return self._check(self.session.request(method, url, **kwargs))
+
+    @staticmethod
+    def _check(resp: Any) -> Any:
+        """Raise :class:`APIRequestError` unless ``resp`` is a success."""
+        # Same rule as ``requests.Response.ok``; also works for httpx responses
+        if resp.status_code >= 400:
             try:
-                detail = resp.json()
+                detail = loads(resp.content)
             except Exception:
                 detail = resp.text
             raise APIRequestError(resp.status_code, detail)
+        return resp
+
+    def _request_cached(
+        self,
+        path: str,
+        build: Callable[[Any], Any],
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        clone: Callable[[Any], Any] = copy.deepcopy,
+    ) -> Any:
+        """GET ``path`` conditionally, reusing ``build``'s result on ``304``.
+
+        Meant for catalog endpoints that rarely change. When the server
+        sends an ``ETag`` the built result is kept, and later calls send
+        ``If-None-Match`` so an unchanged response skips parsing and
+        validation. Each call returns ``clone`` of the cached value (a deep
+        copy by default) so callers never share or mutate the cached object.
+        Only the most recently used results are kept.
+        """
+        key = self._etag_key(path, params)
+        cached = self._etag_entry(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        url = self.api_root + path
+        resp = self.session.request("GET", url, params=params, headers=headers)
+        if cached and resp.status_code == 304:
+            return clone(cached[1])
+        resp = self._check(resp)
+        value = build(loads(resp.content))
+        etag = resp.headers.get("ETag")
+        if etag:
+            self._remember_etag(key, etag, value)
+        return clone(value)
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+        resp = self._send(method, path, **kwargs)
         if resp.status_code == 204:
             return None
-        return resp.json()
+        return loads(resp.content)
 
-    def _iter_paginated(self, path: str, **params: Any) -> Iterator[dict]:
+    def _request_model(
+        self, model: Type[_M], method: str, path: str, **kwargs: Any
+    ) -> _M:
+        # Validate straight from the body bytes; skips the intermediate dict
+        resp = self._send(method, path, **kwargs)
+        return model.model_validate_json(resp.content)
+
+    def _request_adapter(
+        self, adapter: TypeAdapter, method: str, path: str, **kwargs: Any
+    ) -> Any:
+        resp = self._send(method, path, **kwargs)
+        return adapter.validate_json(resp.content)
+
+    def _request_list(
+        self, model: Type[_M], method: str, path: str, **kwargs: Any
+    ) -> List[_M]:
+        resp = self._send(method, path, **kwargs)
+        return _coerce_list_json(model, resp.content)
+
+    def _stream_page(
+        self, path: str, params: Dict[str, Any], page: Dict[str, Any]
+    ) -> Iterator[dict]:
+        """Yield ``results`` items of one page while it is still downloading.
+
+        The page's ``next`` link is stored in ``page`` once the body has
+        been consumed.
+        """
+        import ijson
+
+        url = path if path.startswith("http") else self.api_root + path
+        with self.session.request("GET", url, params=params, stream=True) as resp:
+            self._check(resp)
+            resp.raw.decode_content = True
+
+            def events():
+                for prefix, event, value in ijson.parse(resp.raw, use_float=True):
+                    if prefix == "next" and event in ("string", "null"):
+                        page["next"] = value
+                    yield prefix, event, value
+
+            yield from ijson.items(events(), "results.item")
+
+    def _iter_pages(self, path: str, **params: Any) -> Iterator[Iterable[dict]]:
+        """Yield the ``results`` of each page in turn.
+
+        Pages are lists, or with ``stream_pages`` iterators that must be
+        exhausted before the next page is requested.
+        """
+        root = self.api_root
+        root_len = len(root)
         while True:
-            data = self._request("GET", path, params=params)
-            for item in data.get("results", []):
-                yield item
+            if self._stream_pages:
+                # Items are yielded as they are parsed; only one is held at a time
+                data: Dict[str, Any] = {}
+                yield self._stream_page(path, params, data)
+            else:
+                data = self._request("GET", path, params=params)
+                yield data.get("results", [])
             next_url = data.get("next")
             if not next_url:
                 break
-            if next_url.startswith(self.api_root):
-                path = next_url[len(self.api_root) :]
+            if next_url.startswith(root):
+                path = next_url[root_len:]
             else:
                 path = next_url
             params = {}
 
+    def _iter_paginated(self, path: str, **params: Any) -> Iterator[dict]:
+        for results in self._iter_pages(path, **params):
+            yield from results
+
+    def _iter_models(self, cls: Type[_M], path: str, **params: Any) -> Iterator[_M]:
+        for results in self._iter_pages(path, **params):
+            if isinstance(results, list):
+                # One validator call per page rather than per item
+                yield from _coerce_list(cls, results)
+            else:
+                for item in results:
+                    yield _coerce(cls, item)
+
     # endpoint methods
 
     def get_triggered_limits(self) -> Dict[str, Any]:
@@ -157,10 +344,7 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return self._request("GET", "/usage/events/", params=params)
 
     def list_usage_events_typed(
@@ -169,8 +353,11 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> PaginatedResponse[UsageEvent]:
         """Typed variant of :meth:`list_usage_events`."""
-        data = self.list_usage_events(filters, **params)
-        return PaginatedResponse[UsageEvent].model_validate(data)
+        if filters:
+            params.update(_filter_params(filters))
+        return self._request_adapter(
+            _EVENTS_PAGE, "GET", "/usage/events/", params=params
+        )
 
     def iter_usage_events(
         self,
@@ -178,16 +365,11 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> Iterator[UsageEvent]:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
-        for item in self._iter_paginated("/usage/events/", **params):
-            yield UsageEvent.model_validate(item)
+            params.update(_filter_params(filters))
+        yield from self._iter_models(UsageEvent, "/usage/events/", **params)
 
     def get_usage_event(self, event_id: str) -> UsageEvent:
-        data = self._request("GET", f"/usage/event/{event_id}/")
-        return UsageEvent.model_validate(data)
+        return self._request_model(UsageEvent, "GET", f"/usage/event/{event_id}/")
 
     def list_usage_rollups(
         self,
@@ -195,10 +377,7 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return self._request("GET", "/usage/rollups/", params=params)
 
     def list_usage_rollups_typed(
@@ -207,8 +386,11 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> PaginatedResponse[UsageRollup]:
         """Typed variant of :meth:`list_usage_rollups`."""
-        data = self.list_usage_rollups(filters, **params)
-        return PaginatedResponse[UsageRollup].model_validate(data)
+        if filters:
+            params.update(_filter_params(filters))
+        return self._request_adapter(
+            _ROLLUPS_PAGE, "GET", "/usage/rollups/", params=params
+        )
 
     def iter_usage_rollups(
         self,
@@ -216,12 +398,8 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> Iterator[UsageRollup]:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
-        for item in self._iter_paginated("/usage/rollups/", **params):
-            yield UsageRollup.model_validate(item)
+            params.update(_filter_params(filters))
+        yield from self._iter_models(UsageRollup, "/usage/rollups/", **params)
 
     def list_customers(
         self,
@@ -229,10 +407,7 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return self._request("GET", "/customers/", params=params)
 
     def list_customers_typed(
@@ -241,84 +416,94 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> PaginatedResponse[CustomerOut]:
         """Typed variant of :meth:`list_customers`."""
-        data = self.list_customers(filters, **params)
-        return PaginatedResponse[CustomerOut].model_validate(data)
+        if filters:
+            params.update(_filter_params(filters))
+        return self._request_adapter(
+            _CUSTOMERS_PAGE, "GET", "/customers/", params=params
+        )
 
     def iter_customers(self, **params: Any) -> Iterator[CustomerOut]:
-        for item in self._iter_paginated("/customers/", **params):
-            yield CustomerOut.model_validate(item)
+        yield from self._iter_models(CustomerOut, "/customers/", **params)
 
     def create_customer(self, data: CustomerIn | Dict[str, Any]) -> CustomerOut:
-        payload = data.model_dump(mode="json") if isinstance(data, CustomerIn) else data
-        resp = self._request("POST", "/customers/", json=payload)
-        return CustomerOut.model_validate(resp)
+        return self._request_model(
+            CustomerOut, "POST", "/customers/", **self._json_kwargs(data, CustomerIn)
+        )
 
     def get_customer(self, customer_id: str) -> CustomerOut:
-        data = self._request("GET", f"/customers/{customer_id}/")
-        return CustomerOut.model_validate(data)
+        return self._request_model(CustomerOut, "GET", f"/customers/{customer_id}/")
 
     def update_customer(
         self, customer_id: str, data: CustomerIn | Dict[str, Any]
     ) -> CustomerOut:
-        payload = data.model_dump(mode="json") if isinstance(data, CustomerIn) else data
-        resp = self._request("PUT", f"/customers/{customer_id}/", json=payload)
-        return CustomerOut.model_validate(resp)
+        return self._request_model(
+            CustomerOut,
+            "PUT",
+            f"/customers/{customer_id}/",
+            **self._json_kwargs(data, CustomerIn),
+        )
 
     def delete_customer(self, customer_id: str) -> None:
         self._request("DELETE", f"/customers/{customer_id}/")
         return None
 
     def list_usage_limits(self) -> Iterable[UsageLimitOut]:
-        data = self._request("GET", "/usage-limits/")
-        return [UsageLimitOut.model_validate(i) for i in data]
+        return self._request_list(UsageLimitOut, "GET", "/usage-limits/")
 
     def create_usage_limit(self, data: UsageLimitIn | Dict[str, Any]) -> UsageLimitOut:
-        payload = (
-            data.model_dump(mode="json") if isinstance(data, UsageLimitIn) else data
+        return self._request_model(
+            UsageLimitOut,
+            "POST",
+            "/usage-limits/",
+            **self._json_kwargs(data, UsageLimitIn),
         )
-        resp = self._request("POST", "/usage-limits/", json=payload)
-        return UsageLimitOut.model_validate(resp)
 
     def get_usage_limit(self, limit_id: str) -> UsageLimitOut:
-        data = self._request("GET", f"/usage-limits/{limit_id}/")
-        return UsageLimitOut.model_validate(data)
+        return self._request_model(UsageLimitOut, "GET", f"/usage-limits/{limit_id}/")
 
     def update_usage_limit(
         self, limit_id: str, data: UsageLimitIn | Dict[str, Any]
     ) -> UsageLimitOut:
-        payload = (
-            data.model_dump(mode="json") if isinstance(data, UsageLimitIn) else data
+        return self._request_model(
+            UsageLimitOut,
+            "PUT",
+            f"/usage-limits/{limit_id}/",
+            **self._json_kwargs(data, UsageLimitIn),
         )
-        resp = self._request("PUT", f"/usage-limits/{limit_id}/", json=payload)
-        return UsageLimitOut.model_validate(resp)
 
     def delete_usage_limit(self, limit_id: str) -> None:
         self._request("DELETE", f"/usage-limits/{limit_id}/")
         return None
 
     def list_usage_limit_progress(self) -> Iterable[UsageLimitProgressOut]:
-        data = self._request("GET", "/usage-limits/progress/")
-        return [UsageLimitProgressOut.model_validate(i) for i in data]
+        return self._request_list(
+            UsageLimitProgressOut, "GET", "/usage-limits/progress/"
+        )
 
     def list_vendors(self) -> Iterable[VendorOut]:
-        data = self._request("GET", "/vendors/")
-        return [VendorOut.model_validate(i) for i in data]
+        return self._request_cached(
+            "/vendors/",
+            partial(_coerce_list, VendorOut),
+            clone=_copy_models,
+        )
 
     def list_vendor_services(self, vendor: str) -> Iterable[ServiceOut]:
-        data = self._request("GET", "/services/", params={"vendor": vendor})
-        # Add vendor field to each service object since the API doesn't include it
-        for service in data:
-            service["vendor"] = vendor
-        return [ServiceOut.model_validate(i) for i in data]
+        def build(data: Any) -> List[ServiceOut]:
+            # Add vendor field to each service object since the API doesn't include it
+            return _coerce_list(ServiceOut, [{**i, "vendor": vendor} for i in data])
+
+        return self._request_cached(
+            "/services/", build, params={"vendor": vendor}, clone=_copy_models
+        )
 
     def list_service_costs(self, vendor: str, service: str) -> Iterable[CostUnitOut]:
         """List cost units for a service."""
-        data = self._request(
-            "GET",
+        return self._request_cached(
             "/service-costs/",
+            partial(_coerce_list, CostUnitOut),
             params={"vendor": vendor, "service": service},
+            clone=_copy_models,
         )
-        return [CostUnitOut.model_validate(i) for i in data]
 
     def list_limit_events(
         self, limit_id: Optional[str] = None, **params: Any
@@ -327,8 +512,7 @@ class CostManagerClient(BaseClient):
         params = {k: v for k, v in params.items() if v is not None}
         if limit_id is not None:
             params["limit_id"] = limit_id
-        data = self._request("GET", "/limit-events/", params=params)
-        return [LimitEventOut.model_validate(i) for i in data]
+        return self._request_list(LimitEventOut, "GET", "/limit-events/", params=params)
 
     # Analytics methods
     def analytics_costs_daily(
@@ -337,10 +521,7 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return self._request("GET", "/analytics/costs/daily", params=params)
 
     def analytics_costs_monthly(
@@ -349,10 +530,7 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return self._request("GET", "/analytics/costs/monthly", params=params)
 
     def analytics_costs_snapshots(
@@ -361,12 +539,10 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> SnapshotsResponseSchema:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
-        data = self._request("GET", "/analytics/costs/snapshots", params=params)
-        return SnapshotsResponseSchema.model_validate(data)
+            params.update(_filter_params(filters))
+        return self._request_model(
+            SnapshotsResponseSchema, "GET", "/analytics/costs/snapshots", params=params
+        )
 
     def analytics_costs_trends(
         self,
@@ -374,12 +550,10 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> TrendsResponseSchema:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
-        data = self._request("GET", "/analytics/costs/trends", params=params)
-        return TrendsResponseSchema.model_validate(data)
+            params.update(_filter_params(filters))
+        return self._request_model(
+            TrendsResponseSchema, "GET", "/analytics/costs/trends", params=params
+        )
 
     def analytics_costs_peak_usage(
         self,
@@ -387,10 +561,7 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return self._request("GET", "/analytics/costs/peak-usage", params=params)
 
     def analytics_customers_costs(
@@ -399,12 +570,10 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> List[CustomerBreakdownSchema]:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
-        data = self._request("GET", "/analytics/customers/costs", params=params)
-        return [CustomerBreakdownSchema.model_validate(i) for i in data]
+            params.update(_filter_params(filters))
+        return self._request_list(
+            CustomerBreakdownSchema, "GET", "/analytics/customers/costs", params=params
+        )
 
     def analytics_services_ranking(
         self,
@@ -412,10 +581,7 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return self._request("GET", "/analytics/services/ranking", params=params)
 
     def analytics_vendors_comparison(
@@ -424,10 +590,7 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return self._request("GET", "/analytics/vendors/comparison", params=params)
 
     def analytics_services_efficiency(
@@ -436,10 +599,7 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return self._request("GET", "/analytics/services/efficiency", params=params)
 
     def analytics_services_usage(
@@ -448,10 +608,7 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return self._request("GET", "/analytics/services/usage", params=params)
 
     def analytics_vendors_usage(
@@ -460,10 +617,7 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> Any:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return self._request("GET", "/analytics/vendors/usage", params=params)
 
     def analytics_customers_tokens(
@@ -472,21 +626,20 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> List[CustomerTokenBreakdownSchema]:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
-        data = self._request("GET", "/analytics/customers/tokens", params=params)
-        return [CustomerTokenBreakdownSchema.model_validate(i) for i in data]
+            params.update(_filter_params(filters))
+        return self._request_list(
+            CustomerTokenBreakdownSchema,
+            "GET",
+            "/analytics/customers/tokens",
+            params=params,
+        )
 
     # Reports methods
     def list_reports(self, **params: Any) -> PaginatedResponse[GeneratedReportOut]:
-        data = self._request("GET", "/reports/", params=params)
-        return PaginatedResponse[GeneratedReportOut].model_validate(data)
+        return self._request_adapter(_REPORTS_PAGE, "GET", "/reports/", params=params)
 
     def get_report(self, report_id: str) -> GeneratedReportOut:
-        data = self._request("GET", f"/reports/{report_id}/")
-        return GeneratedReportOut.model_validate(data)
+        return self._request_model(GeneratedReportOut, "GET", f"/reports/{report_id}/")
 
     def download_report(self, report_id: str) -> Any:
         """Download generated report file."""
@@ -499,53 +652,48 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> CostEventsResponse:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
-        data = self._request("GET", "/costs/", params=params)
-        return CostEventsResponse.model_validate(data)
+            params.update(_filter_params(filters))
+        return self._request_model(CostEventsResponse, "GET", "/costs/", params=params)
 
     def list_cost_events_by_response_id(
         self, response_id: str
     ) -> List[ApiCostEventOut]:
-        data = self._request("GET", f"/cost-events/{response_id}")
-        return [ApiCostEventOut.model_validate(i) for i in data]
+        return self._request_list(ApiCostEventOut, "GET", f"/cost-events/{response_id}")
 
     # Webhook methods
     def create_webhook_endpoint(
         self, data: WebhookEndpointCreate | Dict[str, Any]
     ) -> WebhookEndpointOut:
-        payload = (
-            data.model_dump(mode="json")
-            if isinstance(data, WebhookEndpointCreate)
-            else data
+        return self._request_model(
+            WebhookEndpointOut,
+            "POST",
+            "/webhooks/",
+            **self._json_kwargs(data, WebhookEndpointCreate),
         )
-        resp = self._request("POST", "/webhooks/", json=payload)
-        return WebhookEndpointOut.model_validate(resp)
 
     def list_webhook_endpoints(
         self, active_only: bool = False, **params: Any
     ) -> WebhookEndpointsResponse:
         params = {k: v for k, v in params.items() if v is not None}
         params["active_only"] = active_only
-        data = self._request("GET", "/webhooks/", params=params)
-        return WebhookEndpointsResponse.model_validate(data)
+        return self._request_model(
+            WebhookEndpointsResponse, "GET", "/webhooks/", params=params
+        )
 
     def get_webhook_endpoint(self, webhook_uuid: str) -> WebhookEndpointOut:
-        data = self._request("GET", f"/webhooks/{webhook_uuid}/")
-        return WebhookEndpointOut.model_validate(data)
+        return self._request_model(
+            WebhookEndpointOut, "GET", f"/webhooks/{webhook_uuid}/"
+        )
 
     def update_webhook_endpoint(
         self, webhook_uuid: str, data: WebhookEndpointUpdate | Dict[str, Any]
     ) -> WebhookEndpointOut:
-        payload = (
-            data.model_dump(mode="json", exclude_none=True)
-            if isinstance(data, WebhookEndpointUpdate)
-            else data
+        return self._request_model(
+            WebhookEndpointOut,
+            "PUT",
+            f"/webhooks/{webhook_uuid}/",
+            **self._json_kwargs(data, WebhookEndpointUpdate, exclude_none=True),
         )
-        resp = self._request("PUT", f"/webhooks/{webhook_uuid}/", json=payload)
-        return WebhookEndpointOut.model_validate(resp)
 
     def delete_webhook_endpoint(self, webhook_uuid: str) -> None:
         self._request("DELETE", f"/webhooks/{webhook_uuid}/")
@@ -555,52 +703,51 @@ class CostManagerClient(BaseClient):
     def create_export_schedule(
         self, data: ExportScheduleCreate | Dict[str, Any]
     ) -> ExportScheduleOut:
-        payload = (
-            data.model_dump(mode="json")
-            if isinstance(data, ExportScheduleCreate)
-            else data
+        return self._request_model(
+            ExportScheduleOut,
+            "POST",
+            "/schedules/",
+            **self._json_kwargs(data, ExportScheduleCreate),
         )
-        resp = self._request("POST", "/schedules/", json=payload)
-        return ExportScheduleOut.model_validate(resp)
 
     def list_export_schedules(
         self, active_only: bool = True, **params: Any
     ) -> ExportSchedulesResponse:
         params = {k: v for k, v in params.items() if v is not None}
         params["active_only"] = active_only
-        data = self._request("GET", "/schedules/", params=params)
-        return ExportSchedulesResponse.model_validate(data)
+        return self._request_model(
+            ExportSchedulesResponse, "GET", "/schedules/", params=params
+        )
 
     def get_export_schedule(self, schedule_uuid: str) -> ExportScheduleOut:
-        data = self._request("GET", f"/schedules/{schedule_uuid}/")
-        return ExportScheduleOut.model_validate(data)
+        return self._request_model(
+            ExportScheduleOut, "GET", f"/schedules/{schedule_uuid}/"
+        )
 
     def update_export_schedule(
         self, schedule_uuid: str, data: ExportScheduleUpdate | Dict[str, Any]
     ) -> ExportScheduleOut:
-        payload = (
-            data.model_dump(mode="json", exclude_none=True)
-            if isinstance(data, ExportScheduleUpdate)
-            else data
+        return self._request_model(
+            ExportScheduleOut,
+            "PUT",
+            f"/schedules/{schedule_uuid}/",
+            **self._json_kwargs(data, ExportScheduleUpdate, exclude_none=True),
         )
-        resp = self._request("PUT", f"/schedules/{schedule_uuid}/", json=payload)
-        return ExportScheduleOut.model_validate(resp)
 
     def delete_export_schedule(self, schedule_uuid: str) -> None:
         self._request("DELETE", f"/schedules/{schedule_uuid}/")
         return None
 
     def list_export_jobs(self, **params: Any) -> ExportJobsResponse:
-        data = self._request("GET", "/jobs/", params=params)
-        return ExportJobsResponse.model_validate(data)
+        return self._request_model(ExportJobsResponse, "GET", "/jobs/", params=params)
 
     def get_export_job(self, job_uuid: str) -> ExportJobOut:
-        data = self._request("GET", f"/jobs/{job_uuid}/")
-        return ExportJobOut.model_validate(data)
+        return self._request_model(ExportJobOut, "GET", f"/jobs/{job_uuid}/")
 
     def trigger_export_job(self, schedule_uuid: str) -> ExportJobTriggerResponse:
-        data = self._request("POST", f"/schedules/{schedule_uuid}/run/")
-        return ExportJobTriggerResponse.model_validate(data)
+        return self._request_model(
+            ExportJobTriggerResponse, "POST", f"/schedules/{schedule_uuid}/run/"
+        )
 
     # Custom services methods
     def list_custom_services(
@@ -609,38 +756,37 @@ class CostManagerClient(BaseClient):
         **params: Any,
     ) -> List[CustomServiceSummaryOut]:
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
-        data = self._request("GET", "/custom-services/", params=params)
-        return [CustomServiceSummaryOut.model_validate(i) for i in data]
+            params.update(_filter_params(filters))
+        return self._request_list(
+            CustomServiceSummaryOut, "GET", "/custom-services/", params=params
+        )
 
     def create_custom_service(
         self, data: CustomServiceIn | Dict[str, Any]
     ) -> CustomServiceOut:
-        payload = (
-            data.model_dump(mode="json") if isinstance(data, CustomServiceIn) else data
+        return self._request_model(
+            CustomServiceOut,
+            "POST",
+            "/custom-services/",
+            **self._json_kwargs(data, CustomServiceIn),
         )
-        resp = self._request("POST", "/custom-services/", json=payload)
-        return CustomServiceOut.model_validate(resp)
 
     def get_custom_service(self, uuid: str) -> CustomServiceOut:
-        data = self._request("GET", f"/custom-services/{uuid}/")
-        return CustomServiceOut.model_validate(data)
+        return self._request_model(CustomServiceOut, "GET", f"/custom-services/{uuid}/")
 
     def update_custom_service(
         self, uuid: str, data: CustomServiceIn | Dict[str, Any]
     ) -> CustomServiceOut:
-        payload = (
-            data.model_dump(mode="json") if isinstance(data, CustomServiceIn) else data
+        return self._request_model(
+            CustomServiceOut,
+            "PUT",
+            f"/custom-services/{uuid}/",
+            **self._json_kwargs(data, CustomServiceIn),
         )
-        resp = self._request("PUT", f"/custom-services/{uuid}/", json=payload)
-        return CustomServiceOut.model_validate(resp)
 
     def delete_custom_service(self, uuid: str) -> None:
         self._request("DELETE", f"/custom-services/{uuid}/")
         return None
 
     def get_openapi_schema(self) -> Any:
-        return self._request("GET", "/openapi.json")
+        return self._request_cached("/openapi.json", lambda data: data)
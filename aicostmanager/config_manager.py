@@ -1,23 +1,86 @@
 from __future__ import annotations
 
 import configparser
-import json
+import copy
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional
-
-import jwt
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .client import AICMError, CostManagerClient
-from .ini_manager import IniManager
+from .ini_manager import IniManager, _file_signature
 from .triggered_limits_cache import triggered_limits_cache
-from .utils.ini_utils import atomic_write, file_lock, safe_read_config
+from .utils.ini_utils import atomic_write_config, file_lock, safe_read_config
+from .utils.json_utils import dumps, loads
+
+
+# Decoded ``configs`` payloads keyed by the raw INI value, shared by every
+# ConfigManager in the process. Verifying the RS256 tokens dominates
+# ``get_config``; the value only changes when configs are refreshed.
+# Entries are indexed by ``api_id`` and ``config_id`` for direct lookups.
+_ConfigIndex = Tuple[Dict[str, List[dict]], Dict[str, dict]]
+_CONFIG_CACHE: Dict[str, Tuple[_ConfigIndex, float]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+_CONFIG_CACHE_SIZE = 8
+
+
+# Single writer thread for triggered-limit writes. Synchronous writes run on
+# it too, so writes to the file land in the order they were requested.
+# Pending writes are flushed at interpreter exit by ``concurrent.futures``;
+# ``flush_ini_writes`` waits for them earlier.
+_INI_WRITER: Optional[ThreadPoolExecutor] = None
+_INI_WRITER_LOCK = threading.Lock()
+
+logger = logging.getLogger(__name__)
+
+
+def _ini_writer() -> ThreadPoolExecutor:
+    global _INI_WRITER
+    if _INI_WRITER is None:
+        with _INI_WRITER_LOCK:
+            if _INI_WRITER is None:
+                _INI_WRITER = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="aicm-ini"
+                )
+    return _INI_WRITER
+
+
+def flush_ini_writes(timeout: float | None = None) -> None:
+    """Block until the triggered-limit writes queued so far are on disk."""
+    writer = _INI_WRITER
+    if writer is None:
+        return
+    try:
+        # The writer has one thread, so this runs after everything before it
+        marker = writer.submit(lambda: None)
+    except RuntimeError:
+        # Interpreter shutdown; ``concurrent.futures`` has drained the queue
+        return
+    marker.result(timeout)
+
+
+@lru_cache(maxsize=16)
+def _public_key(pem: str) -> Any:
+    """Return the parsed RSA key for ``pem``; the server rotates it rarely."""
+    from cryptography.hazmat.primitives.serialization import load_pem_public_key
+
+    return load_pem_public_key(pem.encode())
 
 
 class ConfigNotFound(AICMError):
     """Raised when a requested config cannot be located."""
 
 
-@dataclass
+# ``Config`` has a defaulted field, so it cannot spell out ``__slots__`` by
+# hand like ``TriggeredLimit``; it gets them on Python 3.10+.
+_CONFIG_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_CONFIG_SLOTS)
 class Config:
     uuid: str
     config_id: str
@@ -29,6 +92,23 @@ class Config:
 
 @dataclass
 class TriggeredLimit:
+    # Built for every limit check; no per-instance ``__dict__``. Spelled out
+    # because ``dataclass(slots=True)`` needs Python 3.10.
+    __slots__ = (
+        "event_id",
+        "limit_id",
+        "threshold_type",
+        "amount",
+        "period",
+        "limit_context",
+        "limit_message",
+        "service_key",
+        "customer_key",
+        "api_key_id",
+        "triggered_at",
+        "expires_at",
+    )
+
     event_id: str
     limit_id: str
     threshold_type: str
@@ -64,24 +144,37 @@ class ConfigManager:
                 raise ValueError("ini_path could not be resolved")
             self.ini_path = ini_path
             self._get_triggered_limits = get_triggered_limits or (lambda: {})
+        # Signature of the file ``self._config`` was read from, if any
+        self._config_signature: Optional[tuple] = None
         if load:
-            with file_lock(self.ini_path):
-                self._config = safe_read_config(self.ini_path)
+            self._read_config()
         else:
             self._config = configparser.ConfigParser()
 
+    def _read_config(self) -> None:
+        """Load ``AICM.ini`` into ``self._config`` unless it is unchanged."""
+        signature = _file_signature(self.ini_path)
+        if signature is None:
+            # Nothing on disk yet; no need to take the lock to read it
+            self._config = safe_read_config(self.ini_path)
+            self._config_signature = None
+            return
+        if signature == self._config_signature:
+            return
+        with file_lock(self.ini_path):
+            # Taken before reading: a write racing with us forces a re-read
+            signature = _file_signature(self.ini_path)
+            self._config = safe_read_config(self.ini_path)
+            # Paired under the lock so threads sharing this instance never
+            # record one read's signature against another read's contents
+            self._config_signature = signature
+
     def _write(self) -> None:
         """Safely write config with file locking."""
         with file_lock(self.ini_path):
-            # Create content string
-            import io
-
-            content = io.StringIO()
-            self._config.write(content)
-            content_str = content.getvalue()
-
-            # Atomic write
-            atomic_write(self.ini_path, content_str)
+            atomic_write_config(self.ini_path, self._config)
+            # ``self._config`` is what is on disk now; no need to re-read it
+            self._config_signature = _file_signature(self.ini_path)
 
     def _update_config(self, force_refresh_limits: bool = False) -> None:
         """Refresh triggered limits and persist to ``AICM.ini``."""
@@ -90,20 +183,61 @@ class ConfigManager:
                 tl_payload = self._get_triggered_limits() or {}
                 if isinstance(tl_payload, dict):
                     tl_data = tl_payload.get("triggered_limits", tl_payload)
-                    self._set_triggered_limits(tl_data)
-                    self._write()
+                    persisted = self._persist_in_order(tl_data)
+                    self._config, self._config_signature = persisted
             except Exception:
                 pass
 
-    def _set_triggered_limits(self, data: dict) -> None:
-        # Remove existing triggered_limits section if it exists
-        if "triggered_limits" in self._config:
-            self._config.remove_section("triggered_limits")
-        self._config.add_section("triggered_limits")
-        self._config["triggered_limits"]["payload"] = json.dumps(data or {})
+    def _persist_triggered_limits(
+        self, data: dict
+    ) -> Tuple[configparser.ConfigParser, Optional[tuple]]:
+        """Merge ``data`` into the INI file as it is on disk and write it.
 
-    def write_triggered_limits(self, data: dict) -> None:
-        """Persist ``triggered_limits`` payload to ``AICM.ini`` if changed."""
+        The file is re-read under the lock so callers do not need to load
+        the INI up front just to update this one section. Only local state
+        is touched, so this is safe to run on the background writer.
+        Returns the written config and the file signature it now matches.
+        """
+        with file_lock(self.ini_path):
+            config = safe_read_config(self.ini_path)
+            # Replace any existing triggered_limits section
+            if "triggered_limits" in config:
+                config.remove_section("triggered_limits")
+            config.add_section("triggered_limits")
+            config["triggered_limits"]["payload"] = dumps(data or {}).decode()
+            atomic_write_config(self.ini_path, config)
+            signature = _file_signature(self.ini_path)
+        return config, signature
+
+    def _persist_in_order(
+        self, data: dict
+    ) -> Tuple[configparser.ConfigParser, Optional[tuple]]:
+        """Run :meth:`_persist_triggered_limits` on the writer and wait for it.
+
+        Queuing behind earlier background writes keeps an older payload from
+        landing on disk after this one.
+        """
+        try:
+            future = _ini_writer().submit(self._persist_triggered_limits, data)
+        except RuntimeError:
+            # Interpreter shutdown: the queue is drained, write directly
+            return self._persist_triggered_limits(data)
+        return future.result()
+
+    def _persist_in_background(self, data: dict) -> None:
+        try:
+            self._persist_triggered_limits(data)
+        except Exception:  # pragma: no cover - disk failures
+            logger.warning("Failed to persist triggered limits", exc_info=True)
+
+    def write_triggered_limits(self, data: dict, *, background: bool = False) -> None:
+        """Persist ``triggered_limits`` payload to ``AICM.ini`` if changed.
+
+        With ``background=True`` the in-memory cache is updated right away and
+        the file write is handed to a single writer thread, so request paths
+        do not wait on disk. Synchronous writes go through the same thread
+        and wait for it, so all writes are applied in submission order.
+        """
         existing = triggered_limits_cache.get_raw()
         if existing is None:
             try:
@@ -118,6 +252,9 @@ class ConfigManager:
                 data["public_key"] = pk
 
         if data == existing:
+            if triggered_limits_cache.get() is not None:
+                # Already decoded and persisted; nothing to do on the hot path
+                return
             token = data.get("encrypted_payload") if data else None
             public_key = data.get("public_key") if data else None
             if token and public_key:
@@ -132,8 +269,10 @@ class ConfigManager:
                 triggered_limits_cache.clear()
             return
 
-        self._set_triggered_limits(data)
-        self._write()
+        if background:
+            _ini_writer().submit(self._persist_in_background, data)
+        else:
+            self._config, self._config_signature = self._persist_in_order(data)
 
         token = data.get("encrypted_payload")
         public_key = data.get("public_key")
@@ -148,74 +287,114 @@ class ConfigManager:
 
     def read_triggered_limits(self) -> dict:
         """Return raw ``triggered_limits`` payload from ``AICM.ini``."""
-        with file_lock(self.ini_path):
-            self._config = safe_read_config(self.ini_path)
+        self._read_config()
         if (
             "triggered_limits" not in self._config
             or "payload" not in self._config["triggered_limits"]
         ):
             return {}
-        return json.loads(self._config["triggered_limits"].get("payload", "{}"))
+        return loads(self._config["triggered_limits"].get("payload", "{}"))
 
     def refresh(self) -> None:
         """Force refresh of local configuration from the API."""
         self._update_config(force_refresh_limits=True)
-        with file_lock(self.ini_path):
-            self._config = safe_read_config(self.ini_path)
+        self._read_config()
 
     # internal helper
     def _decode(self, token: str, public_key: str) -> Optional[dict]:
+        # PyJWT pulls in ``cryptography``; import it only once a token is
+        # actually verified so importing the tracker stays cheap.
+        import jwt
+
         try:
             return jwt.decode(
-                token, public_key, algorithms=["RS256"], issuer="aicm-api"
+                token,
+                _public_key(public_key),
+                algorithms=["RS256"],
+                issuer="aicm-api",
             )
         except Exception:
             return None
 
-    def get_config(self, api_id: str) -> List[Config]:
-        """Return decrypted configs matching ``api_id``."""
-        if "configs" not in self._config or "payload" not in self._config["configs"]:
-            self.refresh()
-
-        configs_raw = json.loads(self._config["configs"].get("payload", "[]"))
-        results: List[Config] = []
-        for item in configs_raw:
+    def _config_index(self) -> _ConfigIndex:
+        raw = self._config["configs"].get("payload", "[]")
+        with _CONFIG_CACHE_LOCK:
+            cached = _CONFIG_CACHE.get(raw)
+        if cached is not None and time.time() < cached[1]:
+            return cached[0]
+
+        by_api_id: Dict[str, List[dict]] = {}
+        by_config_id: Dict[str, dict] = {}
+        expires_at = float("inf")
+        complete = True
+        for item in loads(raw):
             payload = self._decode(item["encrypted_payload"], item["public_key"])
             if not payload:
+                complete = False
                 continue
+            if "exp" in payload:
+                expires_at = min(expires_at, float(payload["exp"]))
             for cfg in payload.get("configs", []):
-                if cfg.get("api_id") == api_id:
-                    results.append(
-                        Config(
-                            uuid=cfg.get("uuid"),
-                            config_id=cfg.get("config_id"),
-                            api_id=cfg.get("api_id"),
-                            last_updated=cfg.get("last_updated"),
-                            handling_config=cfg.get("handling_config", {}),
-                            manual_usage_schema=cfg.get("manual_usage_schema"),
-                        )
-                    )
+                by_api_id.setdefault(cfg.get("api_id"), []).append(cfg)
+                # First entry wins, as with the previous linear scan
+                by_config_id.setdefault(cfg.get("config_id"), cfg)
+        index = (by_api_id, by_config_id)
+        # Only cache fully verified payloads so a bad token is retried
+        if complete:
+            with _CONFIG_CACHE_LOCK:
+                if len(_CONFIG_CACHE) >= _CONFIG_CACHE_SIZE:
+                    _CONFIG_CACHE.clear()
+                _CONFIG_CACHE[raw] = (index, expires_at)
+        return index
+
+    @staticmethod
+    def _to_triggered_limit(event: dict) -> TriggeredLimit:
+        return TriggeredLimit(
+            event_id=event.get("event_id"),
+            limit_id=event.get("limit_id"),
+            threshold_type=event.get("threshold_type"),
+            amount=float(event.get("amount", 0)),
+            period=event.get("period"),
+            limit_context=event.get("limit_context"),
+            limit_message=event.get("limit_message"),
+            service_key=event.get("service_key"),
+            customer_key=event.get("customer_key"),
+            api_key_id=event.get("api_key_id"),
+            triggered_at=event.get("triggered_at"),
+            expires_at=event.get("expires_at"),
+        )
+
+    @staticmethod
+    def _to_config(cfg: dict) -> Config:
+        # ``cfg`` lives in the process-wide index; callers get their own
+        # copies of its mutable fields so edits cannot leak into the cache
+        schema = cfg.get("manual_usage_schema")
+        return Config(
+            uuid=cfg.get("uuid"),
+            config_id=cfg.get("config_id"),
+            api_id=cfg.get("api_id"),
+            last_updated=cfg.get("last_updated"),
+            handling_config=copy.deepcopy(cfg.get("handling_config", {})),
+            manual_usage_schema=None if schema is None else dict(schema),
+        )
+
+    def _configs_for(self, api_id: str) -> List[Config]:
+        return [self._to_config(cfg) for cfg in self._config_index()[0].get(api_id, ())]
+
+    def _config_by_id(self, config_id: str) -> Optional[Config]:
+        cfg = self._config_index()[1].get(config_id)
+        return None if cfg is None else self._to_config(cfg)
 
+    def get_config(self, api_id: str) -> List[Config]:
+        """Return decrypted configs matching ``api_id``."""
+        if "configs" not in self._config or "payload" not in self._config["configs"]:
+            self.refresh()
+
+        results = self._configs_for(api_id)
         if not results:
             # refresh once
             self.refresh()
-            configs_raw = json.loads(self._config["configs"].get("payload", "[]"))
-            for item in configs_raw:
-                payload = self._decode(item["encrypted_payload"], item["public_key"])
-                if not payload:
-                    continue
-                for cfg in payload.get("configs", []):
-                    if cfg.get("api_id") == api_id:
-                        results.append(
-                            Config(
-                                uuid=cfg.get("uuid"),
-                                config_id=cfg.get("config_id"),
-                                api_id=cfg.get("api_id"),
-                                last_updated=cfg.get("last_updated"),
-                                handling_config=cfg.get("handling_config", {}),
-                                manual_usage_schema=cfg.get("manual_usage_schema"),
-                            )
-                        )
+            results = self._configs_for(api_id)
             if not results:
                 raise ConfigNotFound(f"No configuration found for api_id '{api_id}'")
         return results
@@ -225,39 +404,13 @@ class ConfigManager:
         if "configs" not in self._config or "payload" not in self._config["configs"]:
             self.refresh()
 
-        configs_raw = json.loads(self._config["configs"].get("payload", "[]"))
-        for item in configs_raw:
-            payload = self._decode(item["encrypted_payload"], item["public_key"])
-            if not payload:
-                continue
-            for cfg in payload.get("configs", []):
-                if cfg.get("config_id") == config_id:
-                    return Config(
-                        uuid=cfg.get("uuid"),
-                        config_id=cfg.get("config_id"),
-                        api_id=cfg.get("api_id"),
-                        last_updated=cfg.get("last_updated"),
-                        handling_config=cfg.get("handling_config", {}),
-                        manual_usage_schema=cfg.get("manual_usage_schema"),
-                    )
-
-        # Refresh once if not found
-        self.refresh()
-        configs_raw = json.loads(self._config["configs"].get("payload", "[]"))
-        for item in configs_raw:
-            payload = self._decode(item["encrypted_payload"], item["public_key"])
-            if not payload:
-                continue
-            for cfg in payload.get("configs", []):
-                if cfg.get("config_id") == config_id:
-                    return Config(
-                        uuid=cfg.get("uuid"),
-                        config_id=cfg.get("config_id"),
-                        api_id=cfg.get("api_id"),
-                        last_updated=cfg.get("last_updated"),
-                        handling_config=cfg.get("handling_config", {}),
-                        manual_usage_schema=cfg.get("manual_usage_schema"),
-                    )
+        config = self._config_by_id(config_id)
+        if config is None:
+            # Refresh once if not found
+            self.refresh()
+            config = self._config_by_id(config_id)
+        if config is not None:
+            return config
 
         raise ConfigNotFound(f"No configuration found for config_id '{config_id}'")
 
@@ -294,35 +447,14 @@ class ConfigManager:
 
         if not events:
             return []
-        results: List[TriggeredLimit] = []
-        for event in events:
-            matches_service = (
-                (service_key and event.get("service_key") == service_key)
-                if service_key
-                else True
-            )
-
-            matches_client = (
-                (customer_key and event.get("customer_key") == customer_key)
-                if customer_key
-                else True
-            )
-
-            if matches_service and matches_client:
-                results.append(
-                    TriggeredLimit(
-                        event_id=event.get("event_id"),
-                        limit_id=event.get("limit_id"),
-                        threshold_type=event.get("threshold_type"),
-                        amount=float(event.get("amount", 0)),
-                        period=event.get("period"),
-                        limit_context=event.get("limit_context"),
-                        limit_message=event.get("limit_message"),
-                        service_key=event.get("service_key"),
-                        customer_key=event.get("customer_key"),
-                        api_key_id=event.get("api_key_id"),
-                        triggered_at=event.get("triggered_at"),
-                        expires_at=event.get("expires_at"),
-                    )
-                )
-        return results
+        # Only the filters that were given must match; build them once
+        active = [
+            (k, v)
+            for k, v in (("service_key", service_key), ("customer_key", customer_key))
+            if v
+        ]
+        return [
+            self._to_triggered_limit(event)
+            for event in events
+            if all(event.get(k) == v for k, v in active)
+        ]
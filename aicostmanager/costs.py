@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any, Dict, Iterator, Optional
 
 from .client import CostManagerClient
+from .client.base import _filter_params
 from .models import CostEventFilters, CostEventItem, CostEventsResponse
 
 
@@ -47,10 +48,7 @@ class CostQueryManager:
         """Return raw cost event data from the ``/costs`` endpoint."""
 
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
+            params.update(_filter_params(filters))
         return self.client._request("GET", "/costs/", params=params)
 
     def list_costs_typed(
@@ -60,8 +58,11 @@ class CostQueryManager:
     ) -> CostEventsResponse:
         """Typed variant of :meth:`list_costs`."""
 
-        data = self.list_costs(filters, **params)
-        return CostEventsResponse.model_validate(data)
+        if filters:
+            params.update(_filter_params(filters))
+        return self.client._request_model(
+            CostEventsResponse, "GET", "/costs/", params=params
+        )
 
     def iter_costs(
         self,
@@ -71,9 +72,5 @@ class CostQueryManager:
         """Iterate over cost events across paginated responses."""
 
         if filters:
-            if hasattr(filters, "model_dump"):
-                params.update(filters.model_dump(exclude_none=True))
-            else:
-                params.update({k: v for k, v in filters.items() if v is not None})
-        for item in self.client._iter_paginated("/costs/", **params):
-            yield CostEventItem.model_validate(item)
+            params.update(_filter_params(filters))
+        yield from self.client._iter_models(CostEventItem, "/costs/", **params)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import gzip
+import importlib.util
 import logging
 import os
 import threading
@@ -20,6 +22,20 @@ from ..client.exceptions import UsageLimitExceeded
 from ..config_manager import ConfigManager
 from ..ini_manager import IniManager
 from ..logger import create_logger
+from ..utils.json_utils import dumps, loads
+
+
+# HTTP/2 needs the optional ``h2`` package (``pip install httpx[http2]``)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response is None or exc.response.status_code >= 500
+    # Don't retry if client is closed - it won't recover
+    if isinstance(exc, RuntimeError) and "client has been closed" in str(exc):
+        return False
+    return True
 
 
 class DeliveryType(str, Enum):
@@ -41,6 +57,13 @@ class DeliveryConfig:
     log_level: str | None = None
     # For immediate delivery post-send wait before checking limits
     immediate_pause_seconds: float = 5.0
+    # Connection pool for the long-lived delivery HTTP client
+    pool_size: int = 32
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+    # Gzip request bodies of at least this many bytes. Off by default since
+    # the server must accept ``Content-Encoding: gzip``.
+    compress_min_bytes: int | None = None
 
 
 class Delivery(ABC):
@@ -61,42 +84,76 @@ class Delivery(ABC):
             self.__class__.__name__, config.log_file, config.log_level
         )
         self.api_key = config.aicm_api_key or os.getenv("AICM_API_KEY")
+        # API key ID (UUID suffix after the last dot) used to scope limits
+        self._api_key_id = (
+            self.api_key.split(".")[-1]
+            if self.api_key and "." in self.api_key
+            else None
+        )
         self.api_base = config.aicm_api_base or "https://aicostmanager.com"
         self.api_url = config.aicm_api_url or "/api/v1"
         self.timeout = config.timeout
         self._transport = config.transport
-        self._client = httpx.Client(timeout=config.timeout, transport=config.transport)
+        self._client = httpx.Client(
+            timeout=config.timeout,
+            transport=config.transport,
+            limits=httpx.Limits(
+                max_connections=config.pool_size,
+                max_keepalive_connections=config.pool_size,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            http2=config.http2 and _HTTP2_AVAILABLE,
+        )
         self._root = self.api_base.rstrip("/") + self.api_url.rstrip("/")
         self._endpoint = self._root + endpoint
         self._body_key = body_key
         self._headers = {
             "Authorization": f"Bearer {self.api_key}",
             "User-Agent": "aicostmanager-python",
+            "Content-Type": "application/json",
         }
+        self._compress_min_bytes = config.compress_min_bytes
+        self._gzip_headers = {**self._headers, "Content-Encoding": "gzip"}
         self.immediate_pause_seconds = getattr(config, "immediate_pause_seconds", 5.0)
+        # File-backed and reused for every limit check; it re-reads the INI
+        # only when the file changes and never issues incidental GETs that
+        # could stale/clear state.
+        self._limits_config = ConfigManager(
+            ini_path=self.ini_manager.ini_path, load=False
+        )
+        # Retry policies keyed by ``max_attempts``. Tenacity keeps per-run
+        # state thread-locally, so one instance can be reused across sends.
+        self._retry_policies: Dict[int, Retrying] = {}
 
     def _limits_enabled(self) -> bool:
         """Return ``True`` when triggered limits should be enforced."""
         val = self.ini_manager.get_option("tracker", "AICM_LIMITS_ENABLED", "false")
         return str(val).lower() in {"1", "true", "yes", "on"}
 
+    def _retry_policy(self, max_attempts: int) -> Retrying:
+        policy = self._retry_policies.get(max_attempts)
+        if policy is None:
+            policy = Retrying(
+                stop=stop_after_attempt(max_attempts),
+                wait=wait_exponential_jitter(),
+                retry=retry_if_exception(_is_retryable),
+                reraise=True,
+            )
+            self._retry_policies[max_attempts] = policy
+        return policy
+
     def _post_with_retry(
-        self, body: Dict[str, Any], *, max_attempts: int
+        self, body: Dict[str, Any] | bytes, *, max_attempts: int
     ) -> Dict[str, Any]:
-        def _retryable(exc: Exception) -> bool:
-            if isinstance(exc, httpx.HTTPStatusError):
-                return exc.response is None or exc.response.status_code >= 500
-            # Don't retry if client is closed - it won't recover
-            if isinstance(exc, RuntimeError) and "client has been closed" in str(exc):
-                return False
-            return True
-
-        for attempt in Retrying(
-            stop=stop_after_attempt(max_attempts),
-            wait=wait_exponential_jitter(),
-            retry=retry_if_exception(_retryable),
-            reraise=True,
-        ):
+        # Serialize (and compress) once; retries resend the same bytes
+        content = body if isinstance(body, bytes) else dumps(body)
+        headers = self._headers
+        threshold = self._compress_min_bytes
+        if threshold is not None and len(content) >= threshold:
+            # Level 1: usage JSON compresses well even at the fastest setting
+            content = gzip.compress(content, compresslevel=1)
+            headers = self._gzip_headers
+        for attempt in self._retry_policy(max_attempts):
             with attempt:
                 # Check if client is closed before attempting request
                 if self._client.is_closed:
@@ -104,30 +161,22 @@ class Delivery(ABC):
                         "HTTP client has been closed - cannot send request"
                     )
                 resp = self._client.post(
-                    self._endpoint, json=body, headers=self._headers
+                    self._endpoint, content=content, headers=headers
                 )
                 resp.raise_for_status()
-                return resp.json()
+                return loads(resp.content)
         raise RuntimeError("unreachable")
 
     def _check_triggered_limits(self, payload: Dict[str, Any]) -> None:
-        """Raise ``UsageLimitExceeded`` if ``payload`` matches a triggered limit.
-
-        Uses a client-backed ConfigManager to ensure we can refresh and decode
-        triggered limits when the server omits the public key from inline responses.
-        """
-        # Use file-backed ConfigManager to avoid incidental GETs that could stale/clear state
-        cfg = ConfigManager(ini_path=self.ini_manager.ini_path, load=False)
+        """Raise ``UsageLimitExceeded`` if ``payload`` matches a triggered limit."""
+        cfg = self._limits_config
         service_key = payload.get("service_key")
         customer_key = payload.get("customer_key")
+        api_key_id = self._api_key_id
         limits = cfg.get_triggered_limits(
             service_key=service_key,
             customer_key=customer_key,
         )
-        # Extract the API key ID (UUID suffix after the last dot)
-        api_key_id = None
-        if self.api_key and "." in self.api_key:
-            api_key_id = self.api_key.split(".")[-1]
         if api_key_id:
             limits = [l for l in limits if l.api_key_id == api_key_id]
         if limits:
@@ -160,10 +209,32 @@ class Delivery(ABC):
             self._check_triggered_limits(payload)
         return result
 
+    def _enqueue_many(self, payloads: List[Dict[str, Any]]) -> Any:
+        """Enqueue several payloads; subclasses may do this in one operation."""
+        result = None
+        for payload in payloads:
+            result = self._enqueue(payload)
+        return result
+
+    def enqueue_many(self, payloads: List[Dict[str, Any]]) -> Any:
+        """Queue ``payloads`` together and enforce triggered limits once each.
+
+        Limits are checked after everything has been queued, once per
+        distinct ``(service_key, customer_key)`` pair.
+        """
+        result = self._enqueue_many(payloads)
+        if payloads and self._limits_enabled():
+            seen = set()
+            for payload in payloads:
+                key = (payload.get("service_key"), payload.get("customer_key"))
+                if key not in seen:
+                    seen.add(key)
+                    self._check_triggered_limits(payload)
+        return result
+
     def deliver(self, body: Dict[str, Any]) -> None:
         """Queue payloads from a pre-built request body."""
-        for payload in body.get(self._body_key, []):
-            self.enqueue(payload)
+        self.enqueue_many(body.get(self._body_key, []))
 
     def stop(self) -> None:  # pragma: no cover - default no-op
         """Shutdown any background resources."""
@@ -172,9 +243,12 @@ class Delivery(ABC):
 
 @dataclass
 class QueueItem:
-    payload: Dict[str, Any]
+    payload: Optional[Dict[str, Any]]
     id: Optional[int] = None
     retry_count: int = 0
+    # Serialized JSON for ``payload`` when read back from storage. Batches are
+    # sent by splicing these strings together without decoding them.
+    raw: Optional[str] = None
 
 
 class QueueWorker(ABC):
@@ -205,6 +279,7 @@ class QueueDelivery(Delivery, QueueWorker):
         *,
         batch_interval: float = 0.5,
         max_batch_size: int = 1000,
+        max_post_size: int = 100,
         max_attempts: int = 5,
         max_retries: int = 5,
         **kwargs: Any,
@@ -212,30 +287,54 @@ class QueueDelivery(Delivery, QueueWorker):
         super().__init__(config, **kwargs)
         self.batch_interval = batch_interval
         self.max_batch_size = max_batch_size
+        # A claimed batch is posted in chunks of at most this many items so a
+        # large backlog never turns into one oversized request whose failure
+        # reschedules everything.
+        self.max_post_size = max(1, max_post_size)
         self.max_attempts = max_attempts
         self.max_retries = max_retries
         self._total_sent = 0
         self._total_failed = 0
         self._stop = threading.Event()
+        # Set by producers (and ``stop``) so an idle worker wakes immediately
+        # instead of sleeping out its poll interval.
+        self._wake = threading.Event()
+        # True while the worker is inside a blocking ``get_batch``. Producers
+        # only signal then; a worker busy posting re-reads the queue anyway.
+        self._worker_parked = False
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
+    def _encode_batch(self, batch: List[QueueItem]) -> bytes:
+        parts = [
+            item.raw.encode("utf-8") if item.raw is not None else dumps(item.payload)
+            for item in batch
+        ]
+        return b"{" + dumps(self._body_key) + b":[" + b",".join(parts) + b"]}"
+
     def _process_batch(self, batch: List[QueueItem]) -> None:
-        payloads = [item.payload for item in batch]
-        body = {self._body_key: payloads}
+        size = self.max_post_size
+        for start in range(0, len(batch), size):
+            self._post_batch(batch[start : start + size])
+
+    def _post_batch(self, batch: List[QueueItem]) -> None:
+        body = self._encode_batch(batch)
         try:
             data = self._post_with_retry(body, max_attempts=self.max_attempts)
             if self._limits_enabled() and isinstance(data, dict):
                 tl_data = data.get("triggered_limits")
                 if tl_data:
                     # Use a ConfigManager that preserves existing INI settings
-                    cfg = ConfigManager(ini_path=self.ini_manager.ini_path, load=True)
+                    cfg = ConfigManager(ini_path=self.ini_manager.ini_path, load=False)
                     try:
                         cfg.write_triggered_limits(tl_data)
                     except Exception as exc:  # pragma: no cover - network failures
                         self.logger.error("Triggered limits update failed: %s", exc)
         except Exception as exc:  # pragma: no cover - network failures
-            self.logger.error("Delivery failed: %s", exc)
+            # Skip the call entirely when errors are filtered; during an
+            # outage this runs for every failed batch.
+            if self.logger.isEnabledFor(logging.ERROR):
+                self.logger.error("Delivery failed: %s", exc)
             for item in batch:
                 item.retry_count += 1
                 self.reschedule(item)
@@ -259,6 +358,7 @@ class QueueDelivery(Delivery, QueueWorker):
 
     def stop(self) -> None:
         self._stop.set()
+        self._wake.set()
         self._thread.join()
         super().stop()
 
@@ -50,6 +50,7 @@ def create_delivery(
             "max_retries": kwargs.get("max_retries", 5),
             "log_bodies": log_bodies,
             "max_batch_size": kwargs.get("max_batch_size", 1000),
+            "max_post_size": kwargs.get("max_post_size", 100),
         }
         return PersistentDelivery(config=config, **params)
 
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import logging
+import os
 from pathlib import Path
 from typing import Any, Dict
 
 from ..client.exceptions import NoCostsTrackedException, UsageLimitExceeded
-from ..config_manager import ConfigManager
+from ..config_manager import ConfigManager, flush_ini_writes
+from ..ini_manager import IniManager
 from ..models import TrackStatus
 from .base import Delivery, DeliveryConfig, DeliveryType
 
@@ -23,10 +26,6 @@ class ImmediateDelivery(Delivery):
     ) -> None:
         # Create default config if none provided
         if config is None:
-            import os
-
-            from ..ini_manager import IniManager
-
             ini_manager = IniManager(IniManager.resolve_path(None))
             ini_dir = Path(ini_manager.ini_path).resolve().parent
 
@@ -47,6 +46,9 @@ class ImmediateDelivery(Delivery):
             )
             log_level = _get("AICM_LOG_LEVEL") or os.getenv("AICM_LOG_LEVEL")
             timeout = float(_get("AICM_TIMEOUT") or os.getenv("AICM_TIMEOUT") or "10.0")
+            pool_size = int(
+                _get("AICM_POOL_SIZE") or os.getenv("AICM_POOL_SIZE") or "32"
+            )
             immediate_pause_seconds = float(
                 _get("AICM_IMMEDIATE_PAUSE_SECONDS")
                 or os.getenv("AICM_IMMEDIATE_PAUSE_SECONDS")
@@ -73,11 +75,10 @@ class ImmediateDelivery(Delivery):
                 log_file=log_file,
                 log_level=log_level,
                 immediate_pause_seconds=immediate_pause_seconds,
+                pool_size=pool_size,
             )
         else:
             if raise_on_error is None:
-                import os
-
                 val = (
                     config.ini_manager.get_option("tracker", "AICM_RAISE_ON_ERROR")
                     if hasattr(config, "ini_manager")
@@ -98,12 +99,13 @@ class ImmediateDelivery(Delivery):
             tl_data = data.get("triggered_limits", {}) if isinstance(data, dict) else {}
 
             # Always create a ConfigManager for potential limit checking
-            cfg = ConfigManager(ini_path=self.ini_manager.ini_path, load=True)
+            cfg = ConfigManager(ini_path=self.ini_manager.ini_path, load=False)
 
             if tl_data:
                 # Write triggered limits to INI if we received any
                 try:
-                    cfg.write_triggered_limits(tl_data)
+                    # File write happens off the request path
+                    cfg.write_triggered_limits(tl_data, background=True)
                 except Exception as exc:  # pragma: no cover
                     self.logger.error("Failed to persist triggered limits: %s", exc)
 
@@ -152,10 +154,13 @@ class ImmediateDelivery(Delivery):
                     raise UsageLimitExceeded(limits)
             return {"result": result, "triggered_limits": tl_data}
         except Exception as exc:
-            self.logger.exception("Immediate delivery failed: %s", exc)
+            if self.logger.isEnabledFor(logging.ERROR):
+                self.logger.exception("Immediate delivery failed: %s", exc)
             if self.raise_on_error:
                 raise
             return {"result": None, "triggered_limits": {}, "error": str(exc)}
 
-    def stop(self) -> None:  # pragma: no cover - nothing to cleanup
+    def stop(self) -> None:
         self._client.close()
+        # Limits seen on the last requests are written in the background
+        flush_ini_writes()
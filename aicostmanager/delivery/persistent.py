@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
 import sqlite3
@@ -9,7 +8,9 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List
 
+from ..ini_manager import IniManager
 from ..logger import create_logger
+from ..utils.json_utils import dumps
 from .base import DeliveryConfig, DeliveryType, QueueDelivery, QueueItem
 
 
@@ -29,12 +30,11 @@ class PersistentDelivery(QueueDelivery):
         max_retries: int = 5,
         log_bodies: bool = False,
         max_batch_size: int = 1000,
+        max_post_size: int = 100,
         logger: logging.Logger | None = None,
     ) -> None:
         # Create default config if none provided
         if config is None:
-            from ..ini_manager import IniManager
-
             ini_manager = IniManager(IniManager.resolve_path(None))
             ini_dir = Path(ini_manager.ini_path).resolve().parent
 
@@ -57,6 +57,12 @@ class PersistentDelivery(QueueDelivery):
             timeout = float(
                 _get("AICM_TIMEOUT") or os.getenv("AICM_TIMEOUT") or "10.0"
             )
+            pool_size = int(
+                _get("AICM_POOL_SIZE") or os.getenv("AICM_POOL_SIZE") or "32"
+            )
+            compress_min_bytes = _get("AICM_COMPRESS_MIN_BYTES") or os.getenv(
+                "AICM_COMPRESS_MIN_BYTES"
+            )
             immediate_pause_seconds = float(
                 _get("AICM_IMMEDIATE_PAUSE_SECONDS")
                 or os.getenv("AICM_IMMEDIATE_PAUSE_SECONDS")
@@ -72,6 +78,10 @@ class PersistentDelivery(QueueDelivery):
                 log_file=log_file,
                 log_level=log_level,
                 immediate_pause_seconds=immediate_pause_seconds,
+                pool_size=pool_size,
+                compress_min_bytes=(
+                    int(compress_min_bytes) if compress_min_bytes else None
+                ),
             )
 
         # Create default db_path if none provided
@@ -150,6 +160,7 @@ class PersistentDelivery(QueueDelivery):
             config,
             batch_interval=batch_interval,
             max_batch_size=max_batch_size,
+            max_post_size=max_post_size,
             max_attempts=max_attempts,
             max_retries=max_retries,
             logger=self.logger,  # Pass the logger we already created
@@ -157,17 +168,38 @@ class PersistentDelivery(QueueDelivery):
 
     def _enqueue(self, payload: Dict[str, Any]) -> int:
         now = time.time()
-        data = json.dumps(payload)
+        data = dumps(payload).decode("utf-8")
         with self._lock:
             self.conn.execute(
                 "INSERT INTO queue (payload, status, retry_count, scheduled_at, created_at, updated_at) VALUES (?, 'queued', 0, ?, ?, ?)",
                 (data, now, now, now),
             )
             self.conn.commit()
+        if self._worker_parked and not self._wake.is_set():
+            self._wake.set()
+        return self.queued()
+
+    def _enqueue_many(self, payloads: List[Dict[str, Any]]) -> int:
+        now = time.time()
+        rows = [(dumps(p).decode("utf-8"), now, now, now) for p in payloads]
+        with self._lock:
+            self.conn.executemany(
+                "INSERT INTO queue (payload, status, retry_count, scheduled_at, created_at, updated_at) VALUES (?, 'queued', 0, ?, ?, ?)",
+                rows,
+            )
+            self.conn.commit()
+        if rows and self._worker_parked and not self._wake.is_set():
+            self._wake.set()
         return self.queued()
 
     def get_batch(self, max_batch_size: int, *, block: bool = True) -> List[QueueItem]:
         deadline = time.time() + self.batch_interval if block else time.time()
+        # The batching window restarts when the first message shows up so a
+        # burst arriving late in an idle poll still coalesces into one POST.
+        window_open = False
+        # Parked before the first SELECT so an insert racing with it still
+        # signals the wait below.
+        self._worker_parked = block
         rows: List[sqlite3.Row] = []
         while len(rows) < max_batch_size:
             remaining = max_batch_size - len(rows)
@@ -187,12 +219,21 @@ class PersistentDelivery(QueueDelivery):
                     rows.extend(fetched)
             if len(rows) >= max_batch_size:
                 break
-            if not block:
+            if not block or self._stop.is_set():
                 break
+            if rows and not window_open:
+                window_open = True
+                deadline = time.time() + self.batch_interval
             remaining_time = deadline - time.time()
             if remaining_time <= 0:
                 break
-            time.sleep(min(self.poll_interval, remaining_time))
+            # Polling still picks up rows written by other processes and
+            # retries coming due; local enqueues cut the wait short.
+            self._wake.wait(min(self.poll_interval, remaining_time))
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+        self._worker_parked = False
         if not rows:
             return []
         if self.logger.isEnabledFor(logging.DEBUG):
@@ -201,8 +242,9 @@ class PersistentDelivery(QueueDelivery):
         return [
             QueueItem(
                 id=row["id"],
-                payload=json.loads(row["payload"]),
+                payload=None,
                 retry_count=row["retry_count"],
+                raw=row["payload"],
             )
             for row in rows
         ]
@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import configparser
 import os
 from pathlib import Path
 
-from .utils.ini_utils import atomic_write, file_lock, safe_read_config
+from .utils.ini_utils import atomic_write_config, file_lock, safe_read_config
+
+
+def _file_signature(path: str) -> tuple[int, int, int] | None:
+    # Writes go through an atomic rename, so the inode changes even within
+    # one mtime tick
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
 
 
 class IniManager:
@@ -11,8 +22,12 @@ class IniManager:
 
     def __init__(self, ini_path: str | None = None) -> None:
         self.ini_path = self.resolve_path(ini_path)
+        sig = _file_signature(self.ini_path)
         with file_lock(self.ini_path):
             self._config = safe_read_config(self.ini_path)
+        # (stat signature, parsed config) of the last read; seeded here so
+        # the first ``get_option`` calls don't parse the file a second time
+        self._snapshot: tuple | None = (sig, self._config)
 
     @classmethod
     def resolve_path(cls, ini_path: str | None = None) -> str:
@@ -23,19 +38,26 @@ class IniManager:
 
     def _write(self) -> None:
         with file_lock(self.ini_path):
-            import io
-            content = io.StringIO()
-            self._config.write(content)
-            atomic_write(self.ini_path, content.getvalue())
+            atomic_write_config(self.ini_path, self._config)
 
     def get_option(self, section: str, option: str, fallback: str | None = None) -> str | None:
         """Return ``option`` from ``section`` or ``fallback`` when missing."""
-        with file_lock(self.ini_path):
-            config = safe_read_config(self.ini_path)
+        config = self._current_config()
         if config.has_section(section) and option in config[section]:
             return config[section][option]
         return fallback
 
+    def _current_config(self) -> configparser.ConfigParser:
+        # Only re-parse when the file changed
+        sig = _file_signature(self.ini_path)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot[0] == sig:
+            return snapshot[1]
+        with file_lock(self.ini_path):
+            config = safe_read_config(self.ini_path)
+        self._snapshot = (sig, config)
+        return config
+
     def set_option(self, section: str, option: str, value: str) -> None:
         """Persist ``option`` under ``section`` with ``value``."""
         with file_lock(self.ini_path):
@@ -43,7 +65,4 @@ class IniManager:
             if section not in cfg:
                 cfg.add_section(section)
             cfg[section][option] = str(value)
-            import io
-            buf = io.StringIO()
-            cfg.write(buf)
-            atomic_write(self.ini_path, buf.getvalue())
+            atomic_write_config(self.ini_path, cfg)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import List, Optional
 
 from ..client import AsyncCostManagerClient, CostManagerClient
@@ -16,23 +17,35 @@ class TriggeredLimitManager(BaseLimitManager):
         config_manager: ConfigManager | None = None,
     ) -> None:
         super().__init__(client)
-        self.config_manager = config_manager or ConfigManager(client)
+        # Built on first use: loading ``AICM.ini`` takes a file lock, which
+        # would otherwise block the event loop when constructed from async code.
+        self._config_manager = config_manager
 
-    def update_triggered_limits(self) -> None:
-        data = self.client.get_triggered_limits() or {}
+    @property
+    def config_manager(self) -> ConfigManager:
+        if self._config_manager is None:
+            self._config_manager = ConfigManager(self.client)
+        return self._config_manager
+
+    @config_manager.setter
+    def config_manager(self, value: ConfigManager) -> None:
+        self._config_manager = value
+
+    def _store(self, data) -> None:
         if isinstance(data, dict):
             tl_data = data.get("triggered_limits", data)
         else:
             tl_data = data
         self.config_manager.write_triggered_limits(tl_data)
 
+    def update_triggered_limits(self) -> None:
+        data = self.client.get_triggered_limits() or {}
+        self._store(data)
+
     async def update_triggered_limits_async(self) -> None:
         data = await self.client.get_triggered_limits() or {}
-        if isinstance(data, dict):
-            tl_data = data.get("triggered_limits", data)
-        else:
-            tl_data = data
-        self.config_manager.write_triggered_limits(tl_data)
+        # INI locking and writes are blocking; keep them off the event loop
+        await asyncio.to_thread(self._store, data)
 
     def check_triggered_limits(
         self,
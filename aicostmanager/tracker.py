@@ -9,6 +9,7 @@ from typing import Any, Callable, Dict, Optional, Tuple
 from uuid import uuid4
 
 from .client.exceptions import BatchSizeLimitExceeded
+from .config_manager import ConfigManager, flush_ini_writes
 from .delivery import (
     Delivery,
     DeliveryConfig,
@@ -22,6 +23,26 @@ from .usage_utils import (
     get_usage_from_response,
 )
 
+# Vendor prefix of a ``vendor::model`` service key -> api_id
+_VENDOR_TO_API_ID = {
+    "openai": "openai_chat",
+    "anthropic": "anthropic",
+    "amazon-bedrock": "amazon-bedrock",
+    "fireworks-ai": "fireworks-ai",
+    "xai": "openai_chat",  # X.AI uses OpenAI-compatible API
+    "google": "gemini",
+}
+
+# api_id -> vendor prefix used when building a service key from a response
+_API_ID_TO_VENDOR = {
+    "openai_chat": "openai",
+    "openai_responses": "openai",
+    "fireworks-ai": "fireworks-ai",
+    "anthropic": "anthropic",
+    "amazon-bedrock": "amazon-bedrock",
+    "gemini": "google",
+}
+
 
 class Tracker:
     """Lightweight usage tracker for the new ``/track`` endpoint."""
@@ -58,6 +79,11 @@ class Tracker:
         max_attempts = int(_get("AICM_MAX_ATTEMPTS", "3"))
         max_retries = int(_get("AICM_MAX_RETRIES", "5"))
         max_batch_size = int(_get("AICM_MAX_BATCH_SIZE", "1000"))
+        pool_size = int(_get("AICM_POOL_SIZE", "32"))
+        compress_min_bytes_val = _get("AICM_COMPRESS_MIN_BYTES")
+        compress_min_bytes = (
+            int(compress_min_bytes_val) if compress_min_bytes_val else None
+        )
         log_bodies_val = _get("AICM_LOG_BODIES", "false")
         log_bodies = str(log_bodies_val).lower() in {"1", "true", "yes", "on"}
 
@@ -98,6 +124,8 @@ class Tracker:
                 log_file=log_file,
                 log_level=log_level,
                 immediate_pause_seconds=immediate_pause_seconds,
+                pool_size=pool_size,
+                compress_min_bytes=compress_min_bytes,
             )
             self.delivery = create_delivery(
                 resolved_type,
@@ -152,22 +180,11 @@ class Tracker:
         Returns:
             Tuple of (vendor, api_id)
         """
-        if "::" in service_key:
-            vendor = service_key.split("::")[0]
-            # Map vendor to api_id
-            vendor_to_api = {
-                "openai": "openai_chat",
-                "anthropic": "anthropic",
-                "amazon-bedrock": "amazon-bedrock",
-                "fireworks-ai": "fireworks-ai",
-                "xai": "openai_chat",  # X.AI uses OpenAI-compatible API
-                "google": "gemini",
-            }
-            api_id = vendor_to_api.get(vendor, vendor)
-            return vendor, api_id
-        else:
-            # If no "::" found, assume it's already an api_id
-            return service_key, service_key
+        vendor, sep, _ = service_key.partition("::")
+        if sep:
+            return vendor, _VENDOR_TO_API_ID.get(vendor, vendor)
+        # If no "::" found, assume it's already an api_id
+        return service_key, service_key
 
     def _build_final_service_key(
         self, service_key: str, api_id: str, response_or_chunk: Any
@@ -178,15 +195,7 @@ class Tracker:
             model = getattr(response_or_chunk, "model", None)
             if model:
                 # Map api_id back to vendor
-                api_to_vendor = {
-                    "openai_chat": "openai",
-                    "openai_responses": "openai",
-                    "fireworks-ai": "fireworks-ai",
-                    "anthropic": "anthropic",
-                    "amazon-bedrock": "amazon-bedrock",
-                    "gemini": "google",
-                }
-                vendor = api_to_vendor.get(api_id, api_id)
+                vendor = _API_ID_TO_VENDOR.get(api_id, api_id)
                 return f"{vendor}::{model}"
         return service_key
 
@@ -415,13 +424,11 @@ class Tracker:
                     tl_data = data.get("triggered_limits")
                     if tl_data:
                         # Use a ConfigManager that preserves existing INI settings
-                        from .config_manager import ConfigManager
-
                         cfg = ConfigManager(
-                            ini_path=self.ini_manager.ini_path, load=True
+                            ini_path=self.ini_manager.ini_path, load=False
                         )
                         try:
-                            cfg.write_triggered_limits(tl_data)
+                            cfg.write_triggered_limits(tl_data, background=True)
                         except Exception as exc:  # pragma: no cover
                             self.logger.error("Triggered limits update failed: %s", exc)
                 return data
@@ -429,14 +436,15 @@ class Tracker:
                 self.logger.error("Batch delivery failed: %s", exc)
                 raise
         else:
-            # For queued delivery, enqueue all records
-            total_queued = 0
-            response_ids = []
-            for record in built_records:
-                result = self.delivery.enqueue(record)
-                if isinstance(result, int):
-                    total_queued = result  # Last queue length
-                response_ids.append(record["response_id"])
+            # For queued delivery, enqueue all records in one operation
+            if isinstance(self.delivery, Delivery):
+                result = self.delivery.enqueue_many(built_records)
+            else:
+                result = None
+                for record in built_records:
+                    result = self.delivery.enqueue(record)
+            total_queued = result if isinstance(result, int) else 0
+            response_ids = [record["response_id"] for record in built_records]
 
             return {"queued": total_queued, "response_ids": response_ids}
 
@@ -733,3 +741,6 @@ class Tracker:
         """
         if getattr(self, "delivery", None) is not None:
             self.delivery.stop()
+        # Limits from tracked responses are written to the INI in the
+        # background; make sure they are on disk once the tracker is closed
+        flush_ini_writes()
@@ -7,6 +7,8 @@ from typing import List, Optional
 class TriggeredLimitsCache:
     """Thread-safe in-memory cache for triggered limits payloads."""
 
+    __slots__ = ("_lock", "_data", "_raw")
+
     def __init__(self) -> None:
         self._lock = RLock()
         self._data: Optional[List[dict]] = None
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from typing import Any
 
 
+_LEAF_TYPES = frozenset({str, int, float, bool})
+
+
 def _to_serializable_dict(data: Any, _seen: set[int] | None = None) -> dict[str, Any]:
     """Convert usage objects to plain dictionaries."""
+    # Token counts and names make up most of the tree; return them before the
+    # mock, cycle and model probes below.
+    if type(data) in _LEAF_TYPES:
+        return data
     if data is None:
         return {}
 
@@ -249,102 +256,139 @@ def _coerce_mapping(obj: Any) -> dict:
     return out
 
 
-def get_usage_from_response(response: Any, api_id: str) -> dict[str, Any]:
-    """Return JSON-serializable usage info from an API response."""
+def _openai_usage(response: Any) -> dict[str, Any]:
+    return _to_serializable_dict(getattr(response, "usage", None))
+
+
+def _anthropic_usage(response: Any) -> dict[str, Any]:
+    usage = response if not hasattr(response, "usage") else getattr(response, "usage")
+    return _to_serializable_dict(usage)
+
+
+def _bedrock_usage(response: Any) -> dict[str, Any]:
     usage: Any = None
-    if api_id in {"openai_chat", "openai_responses", "fireworks-ai"}:
+    if isinstance(response, Mapping):
+        if "usage" in response:
+            usage = response["usage"]
+        elif all(k in response for k in ("inputTokens", "outputTokens", "totalTokens")):
+            usage = response
+        elif "ResponseMetadata" in response and "usage" in response:
+            usage = response.get("usage")
+    else:
         usage = getattr(response, "usage", None)
-    elif api_id == "anthropic":
-        usage = (
-            response if not hasattr(response, "usage") else getattr(response, "usage")
-        )
-    elif api_id == "amazon-bedrock":
-        if isinstance(response, Mapping):
-            if "usage" in response:
-                usage = response["usage"]
-            elif all(
-                k in response for k in ("inputTokens", "outputTokens", "totalTokens")
-            ):
-                usage = response
-            elif "ResponseMetadata" in response and "usage" in response:
-                usage = response.get("usage")
-        else:
-            usage = getattr(response, "usage", None)
-    elif api_id == "gemini":
-        # Try both camelCase and snake_case variants
-        usage = getattr(response, "usageMetadata", None) or getattr(
-            response, "usage_metadata", None
-        )
-        # If found, normalize to our standardized format
-        if usage is not None:
-            return _normalize_gemini_usage(usage)
     return _to_serializable_dict(usage)
 
 
-def get_streaming_usage_from_response(chunk: Any, api_id: str) -> dict[str, Any]:
-    """Extract usage information from streaming response chunks."""
+def _gemini_usage(response: Any) -> dict[str, Any]:
+    # Try both camelCase and snake_case variants
+    usage = getattr(response, "usageMetadata", None) or getattr(
+        response, "usage_metadata", None
+    )
+    # If found, normalize to our standardized format
+    if usage is not None:
+        return _normalize_gemini_usage(usage)
+    return _to_serializable_dict(None)
+
+
+def _openai_streaming_usage(chunk: Any) -> dict[str, Any]:
+    # Some SDKs put usage directly on the event
+    usage = getattr(chunk, "usage", None)
+    # Responses API events often nest usage on the inner .response
+    if not usage and hasattr(chunk, "response") and hasattr(chunk.response, "usage"):
+        usage = getattr(chunk.response, "usage")
+    # Raw/dict fallbacks
+    if not usage and isinstance(chunk, Mapping):
+        usage = chunk.get("usage") or (chunk.get("response", {}) or {}).get("usage")
+    return _to_serializable_dict(usage)
+
+
+def _anthropic_streaming_usage(chunk: Any) -> dict[str, Any]:
     usage: Any = None
-    if api_id in {"openai_chat", "openai_responses", "fireworks-ai"}:
-        # Some SDKs put usage directly on the event
-        usage = getattr(chunk, "usage", None)
-        # Responses API events often nest usage on the inner .response
-        if (
-            not usage
-            and hasattr(chunk, "response")
-            and hasattr(chunk.response, "usage")
-        ):
-            usage = getattr(chunk.response, "usage")
-        # Raw/dict fallbacks
-        if not usage and isinstance(chunk, Mapping):
-            usage = chunk.get("usage") or (chunk.get("response", {}) or {}).get("usage")
-
-    elif api_id == "anthropic":
-        if hasattr(chunk, "usage"):
-            usage = getattr(chunk, "usage")
-        elif hasattr(chunk, "message") and hasattr(chunk.message, "usage"):
-            usage = getattr(chunk.message, "usage")
-
-    elif api_id == "amazon-bedrock":
-        if isinstance(chunk, Mapping):
-            if "metadata" in chunk and "usage" in chunk["metadata"]:
-                usage = chunk["metadata"]["usage"]
-            elif "usage" in chunk:
-                usage = chunk["usage"]
-
-    elif api_id == "gemini":
-        # Try multiple locations for usage metadata, both camelCase and snake_case
-        meta = None
-
-        # 1) direct on the event (both variants)
-        meta = getattr(chunk, "usageMetadata", None) or getattr(
-            chunk, "usage_metadata", None
-        )
+    if hasattr(chunk, "usage"):
+        usage = getattr(chunk, "usage")
+    elif hasattr(chunk, "message") and hasattr(chunk.message, "usage"):
+        usage = getattr(chunk.message, "usage")
+    return _to_serializable_dict(usage)
 
-        # 2) sometimes nested under .model_response
-        if meta is None and hasattr(chunk, "model_response"):
-            meta = getattr(chunk.model_response, "usageMetadata", None) or getattr(
-                chunk.model_response, "usage_metadata", None
-            )
-
-        # 3) dict-like fallback
-        if meta is None and isinstance(chunk, Mapping):
-            model_resp = chunk.get("model_response")
-            meta = (
-                chunk.get("usageMetadata")
-                or chunk.get("usage_metadata")
-                or (model_resp or {}).get("usageMetadata")
-                or (model_resp or {}).get("usage_metadata")
-                if isinstance(model_resp, Mapping)
-                else None
-            )
-
-        # If found, normalize to our standardized format
-        if meta is not None:
-            return _normalize_gemini_usage(meta)
 
+def _bedrock_streaming_usage(chunk: Any) -> dict[str, Any]:
+    usage: Any = None
+    if isinstance(chunk, Mapping):
+        if "metadata" in chunk and "usage" in chunk["metadata"]:
+            usage = chunk["metadata"]["usage"]
+        elif "usage" in chunk:
+            usage = chunk["usage"]
     return _to_serializable_dict(usage)
 
 
+def _gemini_streaming_usage(chunk: Any) -> dict[str, Any]:
+    # Try multiple locations for usage metadata, both camelCase and snake_case
+    # 1) direct on the event (both variants)
+    meta = getattr(chunk, "usageMetadata", None) or getattr(
+        chunk, "usage_metadata", None
+    )
+
+    # 2) sometimes nested under .model_response
+    if meta is None and hasattr(chunk, "model_response"):
+        meta = getattr(chunk.model_response, "usageMetadata", None) or getattr(
+            chunk.model_response, "usage_metadata", None
+        )
+
+    # 3) dict-like fallback
+    if meta is None and isinstance(chunk, Mapping):
+        model_resp = chunk.get("model_response")
+        meta = (
+            chunk.get("usageMetadata")
+            or chunk.get("usage_metadata")
+            or (model_resp or {}).get("usageMetadata")
+            or (model_resp or {}).get("usage_metadata")
+            if isinstance(model_resp, Mapping)
+            else None
+        )
+
+    # If found, normalize to our standardized format
+    if meta is not None:
+        return _normalize_gemini_usage(meta)
+    return _to_serializable_dict(None)
+
+
+# Extractors keyed by ``api_id`` so each call is a single dict lookup rather
+# than a chain of string comparisons.
+_USAGE_EXTRACTORS: dict[str, Callable[[Any], dict[str, Any]]] = {
+    "openai_chat": _openai_usage,
+    "openai_responses": _openai_usage,
+    "fireworks-ai": _openai_usage,
+    "anthropic": _anthropic_usage,
+    "amazon-bedrock": _bedrock_usage,
+    "gemini": _gemini_usage,
+}
+
+_STREAMING_USAGE_EXTRACTORS: dict[str, Callable[[Any], dict[str, Any]]] = {
+    "openai_chat": _openai_streaming_usage,
+    "openai_responses": _openai_streaming_usage,
+    "fireworks-ai": _openai_streaming_usage,
+    "anthropic": _anthropic_streaming_usage,
+    "amazon-bedrock": _bedrock_streaming_usage,
+    "gemini": _gemini_streaming_usage,
+}
+
+
+def get_usage_from_response(response: Any, api_id: str) -> dict[str, Any]:
+    """Return JSON-serializable usage info from an API response."""
+    extractor = _USAGE_EXTRACTORS.get(api_id)
+    if extractor is None:
+        return _to_serializable_dict(None)
+    return extractor(response)
+
+
+def get_streaming_usage_from_response(chunk: Any, api_id: str) -> dict[str, Any]:
+    """Extract usage information from streaming response chunks."""
+    extractor = _STREAMING_USAGE_EXTRACTORS.get(api_id)
+    if extractor is None:
+        return _to_serializable_dict(None)
+    return extractor(chunk)
+
+
 __all__ = [
     "get_usage_from_response",
     "get_streaming_usage_from_response",
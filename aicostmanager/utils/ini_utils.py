@@ -5,6 +5,7 @@ import os
 import tempfile
 import time
 from contextlib import contextmanager
+from typing import IO, Any, Callable
 
 
 @contextmanager
@@ -84,7 +85,7 @@ def clean_duplicate_sections(ini_path: str) -> None:
     atomic_write(ini_path, "".join(cleaned_lines))
 
 
-def atomic_write(file_path: str, content: str) -> None:
+def _atomic_replace(file_path: str, write: Callable[[IO[str]], Any]) -> None:
     if not file_path:
         return
     dir_path = os.path.dirname(file_path)
@@ -94,13 +95,22 @@ def atomic_write(file_path: str, content: str) -> None:
     temp_fd, temp_path = tempfile.mkstemp(dir=temp_dir, prefix=f".{os.path.basename(file_path)}.tmp")
     try:
         with os.fdopen(temp_fd, "w") as f:
-            f.write(content)
+            write(f)
             f.flush()
             os.fsync(f.fileno())
-        os.rename(temp_path, file_path)
+        os.replace(temp_path, file_path)
     except Exception:
         try:
             os.unlink(temp_path)
         except (OSError, FileNotFoundError):
             pass
         raise
+
+
+def atomic_write(file_path: str, content: str) -> None:
+    _atomic_replace(file_path, lambda f: f.write(content))
+
+
+def atomic_write_config(file_path: str, config: configparser.ConfigParser) -> None:
+    """Atomically replace ``file_path`` with ``config``, written straight to disk."""
+    _atomic_replace(file_path, config.write)
@@ -0,0 +1,55 @@
+"""JSON helpers that use :mod:`orjson` when it is installed."""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import Any
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Compact output like orjson's; non-finite floats are handled in ``dumps``
+_STDLIB_OPTIONS: dict[str, Any] = {
+    "ensure_ascii": False,
+    "separators": (",", ":"),
+    "allow_nan": False,
+}
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 encoded JSON."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Values orjson rejects (e.g. >64-bit ints) go through the stdlib
+            pass
+    try:
+        text = json.dumps(obj, **_STDLIB_OPTIONS)
+    except ValueError as exc:
+        if not str(exc).startswith("Out of range float values"):
+            raise
+        # orjson writes NaN and +/-Infinity as ``null``; match it
+        text = json.dumps(_finite(obj), **_STDLIB_OPTIONS)
+    return text.encode("utf-8")
+
+
+def _finite(obj: Any) -> Any:
+    """Return ``obj`` with non-finite floats replaced by ``None``."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(v) for v in obj]
+    return obj
+
+
+def loads(data: bytes | bytearray | str) -> Any:
+    """Deserialize JSON from ``data``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 from collections.abc import AsyncIterable, Iterable, Iterator
+from types import MethodType
 from typing import Any, Callable
 
 from .delivery import DeliveryType
@@ -12,13 +13,38 @@ from .usage_utils import get_streaming_usage_from_response, get_usage_from_respo
 class _Proxy:
     """Recursive proxy that intercepts method calls for tracking."""
 
-    def __init__(self, obj: Any, wrapper: "BaseLLMWrapper") -> None:
+    # One proxy per attribute hop; slots keep them small and make the
+    # ``self._obj``/``self._calls`` loads in ``__getattr__`` cheaper.
+    __slots__ = ("_obj", "_wrapper", "_calls", "_path")
+
+    def __init__(self, obj: Any, wrapper: "BaseLLMWrapper", path: str = "") -> None:
         object.__setattr__(self, "_obj", obj)
         object.__setattr__(self, "_wrapper", wrapper)
+        # Dotted prefix of this namespace on the client, e.g. ``"models."``
+        object.__setattr__(self, "_path", path)
+        # name -> (attr, tracking callable or child proxy) for reuse while
+        # the underlying attribute is unchanged
+        object.__setattr__(self, "_calls", {})
 
     def __getattr__(self, name: str) -> Any:
+        # Dunders (``__dict__``, ``__aiter__`` probes...) are forwarded as-is,
+        # never wrapped or tracked
+        if name[:2] == "__" and name[-2:] == "__":
+            return getattr(self._obj, name)
         attr = getattr(self._obj, name)
+        cached = self._calls.get(name)
+        # Bound methods are rebuilt on every lookup but compare equal while
+        # they wrap the same function and instance; anything else must be
+        # the very same object, whatever its ``__eq__`` says.
+        if cached is not None and (
+            cached[0] is attr or (type(attr) is MethodType and cached[0] == attr)
+        ):
+            return cached[1]
         if callable(attr):
+            if self._path + name in self._wrapper.untracked_methods:
+                # Never returns usage: hand back the bound method untouched
+                self._calls[name] = (attr, attr)
+                return attr
             # Check if this callable has non-private attributes (like MagicMock objects)
             # If it does, we should proxy it instead of wrapping it as a function
             # This preserves attribute access like client.chat.completions
@@ -48,25 +74,36 @@ class _Proxy:
                 # This callable has attributes (e.g., MagicMock). Proxy it so nested
                 # attribute access like .completions.create works without turning it
                 # into a bare function.
-                return _Proxy(attr, self._wrapper)
+                return _Proxy(attr, self._wrapper, f"{self._path}{name}.")
+
+            call = self._make_call(attr)
+            self._calls[name] = (attr, call)
+            return call
+        if not _should_wrap(attr):
+            return attr
+        # Namespaces like ``client.chat`` are proxied once, so a repeated
+        # ``chat.completions.create`` walk is a few dict hits
+        proxy = _Proxy(attr, self._wrapper, f"{self._path}{name}.")
+        self._calls[name] = (attr, proxy)
+        return proxy
 
-            if inspect.iscoroutinefunction(attr):
+    def _make_call(self, attr: Callable[..., Any]) -> Callable[..., Any]:
+        wrapper = self._wrapper
+        if inspect.iscoroutinefunction(attr):
 
-                async def async_call(*args, **kwargs):
-                    model = self._wrapper._extract_model(attr, args, kwargs)
-                    result = await attr(*args, **kwargs)
-                    return await self._wrapper._handle_async_result(result, model)
+            async def async_call(*args, **kwargs):
+                model = wrapper._extract_model(attr, args, kwargs)
+                result = await attr(*args, **kwargs)
+                return await wrapper._handle_async_result(result, model)
 
-                return async_call
-            else:
+            return async_call
 
-                def sync_call(*args, **kwargs):
-                    model = self._wrapper._extract_model(attr, args, kwargs)
-                    result = attr(*args, **kwargs)
-                    return self._wrapper._handle_result(result, model)
+        def sync_call(*args, **kwargs):
+            model = wrapper._extract_model(attr, args, kwargs)
+            result = attr(*args, **kwargs)
+            return wrapper._handle_result(result, model)
 
-                return sync_call
-        return _Proxy(attr, self._wrapper) if _should_wrap(attr) else attr
+        return sync_call
 
     def __call__(self, *args, **kwargs):
         # Fast-path for unittest.mock objects: avoid signature introspection
@@ -105,11 +142,57 @@ def _should_wrap(obj: Any) -> bool:
     )
 
 
+_TRACK, _STREAM, _ASYNC_STREAM = 0, 1, 2
+# Result type -> how ``_handle_result`` treats it. SDKs return a handful of
+# response/stream classes, so the ABC checks run once per class.
+_result_kinds: dict[type, int] = {}
+
+
+def _result_kind(result: Any) -> int:
+    cls = type(result)
+    kind = _result_kinds.get(cls)
+    if kind is not None:
+        return kind
+    # Don't treat Mock objects as iterables even if they claim to be. Mocks get
+    # a fresh class per instance, so they are never cached.
+    if hasattr(result, "_mock_name") or cls.__name__ in (
+        "Mock",
+        "MagicMock",
+        "AsyncMock",
+    ):
+        return _TRACK
+    if isinstance(result, AsyncIterable):
+        kind = _ASYNC_STREAM
+    elif isinstance(result, Iterator) and not isinstance(
+        result, (str, bytes, bytearray)
+    ):
+        kind = _STREAM
+    else:
+        kind = _TRACK
+    _result_kinds[cls] = kind
+    return kind
+
+
 class BaseLLMWrapper:
     """Base wrapper that tracks usage for LLM SDK clients."""
 
     api_id: str
     vendor_name: str = ""
+    # Dotted paths of SDK methods that never report usage; they bypass
+    # tracking entirely. Matched on the full path so e.g.
+    # ``responses.retrieve``, which returns billable usage, is still tracked.
+    untracked_methods: frozenset[str] = frozenset(
+        {
+            "close",
+            "aclose",
+            "models.list",
+            "models.retrieve",
+            "models.delete",
+            "files.list",
+            "files.retrieve",
+            "files.delete",
+        }
+    )
 
     def __init__(
         self,
@@ -189,26 +272,46 @@ class BaseLLMWrapper:
         model_id = model or "unknown-model"
         return f"{vendor}::{model_id}"
 
+    @staticmethod
+    def _response_id(response: Any) -> Any:
+        # Try multiple field names for response ID
+        response_id = (
+            getattr(response, "id", None)
+            or getattr(response, "response_id", None)
+            or getattr(response, "responseId", None)
+        )
+        # Also try dict access for some response formats
+        if response_id is None and isinstance(response, dict):
+            response_id = (
+                response.get("response_id")
+                or response.get("responseId")
+                or response.get("id")
+            )
+        return response_id
+
     def _track_usage(self, response: Any, model: str | None) -> Any:
         usage = get_usage_from_response(response, self.api_id)
         if usage:
-            # Try multiple field names for response ID
-            response_id = (
-                getattr(response, "id", None)
-                or getattr(response, "response_id", None)
-                or getattr(response, "responseId", None)
-            )
-            # Also try dict access for some response formats
-            if response_id is None and isinstance(response, dict):
-                response_id = (
-                    response.get("response_id")
-                    or response.get("responseId")
-                    or response.get("id")
-                )
             self._tracker.track(
                 self._build_service_key(model),
                 usage,
-                response_id=response_id,
+                response_id=self._response_id(response),
+                customer_key=self.customer_key,
+                context=self.context,
+                anonymize_fields=self._anonymize_fields,
+                anonymizer=self._anonymizer,
+            )
+        return response
+
+    async def _track_usage_async(self, response: Any, model: str | None) -> Any:
+        usage = get_usage_from_response(response, self.api_id)
+        if usage:
+            # Delivery may post, write SQLite or update the INI file, so let
+            # the tracker run it off the event loop.
+            await self._tracker.track_async(
+                self._build_service_key(model),
+                usage,
+                response_id=self._response_id(response),
                 customer_key=self.customer_key,
                 context=self.context,
                 anonymize_fields=self._anonymize_fields,
@@ -301,36 +404,20 @@ class BaseLLMWrapper:
                 new_result = dict(result)
                 new_result["stream"] = wrapped
                 return new_result
-        # Don't treat Mock objects as iterables even if they claim to be
-        if hasattr(result, "_mock_name") or type(result).__name__ in (
-            "Mock",
-            "MagicMock",
-            "AsyncMock",
-        ):
-            return self._track_usage(result, model)
-        if isinstance(result, AsyncIterable):
+        kind = _result_kind(result)
+        if kind == _ASYNC_STREAM:
             return self._wrap_stream_async(result, model)
-        if isinstance(result, Iterator) and not isinstance(
-            result, (str, bytes, bytearray)
-        ):
+        if kind == _STREAM:
             return self._wrap_stream(result, model)
         return self._track_usage(result, model)
 
     async def _handle_async_result(self, result: Any, model: str | None):
-        # Don't treat Mock objects as iterables even if they claim to be
-        if hasattr(result, "_mock_name") or type(result).__name__ in (
-            "Mock",
-            "MagicMock",
-            "AsyncMock",
-        ):
-            return self._track_usage(result, model)
-        if isinstance(result, AsyncIterable):
+        kind = _result_kind(result)
+        if kind == _ASYNC_STREAM:
             return self._wrap_stream_async(result, model)
-        if isinstance(result, Iterator) and not isinstance(
-            result, (str, bytes, bytearray)
-        ):
+        if kind == _STREAM:
             return self._wrap_stream(result, model)
-        return self._track_usage(result, model)
+        return await self._track_usage_async(result, model)
 
     # ------------------------------------------------------------------
     def __getattr__(self, name: str) -> Any:  # pragma: no cover - delegated
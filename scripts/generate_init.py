@@ -0,0 +1,140 @@
+"""Generate ``aicostmanager/__init__.py`` from ``aicostmanager/_exports.toml``.
+
+Usage::
+
+    python scripts/generate_init.py          # rewrite __init__.py
+    python scripts/generate_init.py --check  # exit 1 if __init__.py is stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # pragma: no cover - Python < 3.11
+    import tomli as tomllib
+
+ROOT = Path(__file__).resolve().parents[1]
+MANIFEST = ROOT / "aicostmanager" / "_exports.toml"
+INIT = ROOT / "aicostmanager" / "__init__.py"
+PYPROJECT = ROOT / "pyproject.toml"
+
+LINE_LENGTH = 88
+
+HEADER = '''"""Python SDK for the AICostManager API."""
+
+# This file is generated by scripts/generate_init.py from _exports.toml.
+# Edit the manifest and regenerate instead of changing it by hand.
+
+from __future__ import annotations
+
+import importlib
+import os
+from typing import TYPE_CHECKING, Any
+
+__version__ = "{version}"
+
+# Public names are resolved lazily (PEP 562) so ``import aicostmanager`` does
+# not pay for httpx, tenacity, pydantic models or JWT handling until a class
+# is actually used.
+'''
+
+FOOTER = '''
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY.get(name)
+    if module_path is not None:
+        value = getattr(importlib.import_module(module_path, __name__), name)
+        globals()[name] = value
+        return value
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
+'''
+
+EAGER = '''
+# Resolve every export up front when requested (useful in CI to surface broken
+# imports that lazy loading would otherwise hide until first use).
+if os.getenv("AICM_EAGER_IMPORT", "").lower() in {"1", "true", "yes", "on"}:
+    for _name in _LAZY:
+        __getattr__(_name)
+    del _name
+'''
+
+
+def _import_block(module: str, names: list[str], indent: str) -> str:
+    # isort ordering: classes before functions, case-sensitive within each.
+    ordered = sorted(names, key=lambda n: (n[0].islower(), n))
+    line = f"{indent}from .{module} import {', '.join(ordered)}"
+    if len(line) <= LINE_LENGTH:
+        return line + "\n"
+    body = "".join(f"{indent}    {name},\n" for name in ordered)
+    return f"{indent}from .{module} import (\n{body}{indent})\n"
+
+
+def render(manifest: dict, version: str) -> str:
+    modules = {k: v["exports"] for k, v in manifest.items() if isinstance(v, dict)}
+    submodules = manifest.get("submodules", [])
+
+    out = [HEADER.format(version=version)]
+    out.append("_LAZY: dict[str, str] = {\n")
+    for module, names in modules.items():
+        for name in names:
+            out.append(f'    "{name}": ".{module}",\n')
+    out.append("}\n\n")
+
+    out.append(
+        "# Submodules that were implicitly available as attributes when the package\n"
+        "# imported everything eagerly.\n"
+        "_SUBMODULES = frozenset(\n    {\n"
+    )
+    out.extend(f'        "{name}",\n' for name in submodules)
+    out.append("    }\n)\n\n")
+
+    out.append("if TYPE_CHECKING:\n")
+    for module in sorted(modules):
+        out.append(_import_block(module, modules[module], "    "))
+
+    out.append(FOOTER)
+    out.append("__all__ = [\n")
+    for names in modules.values():
+        out.extend(f'    "{name}",\n' for name in names)
+    out.append('    "__version__",\n]\n')
+    out.append(EAGER)
+    return "".join(out)
+
+
+def generate() -> str:
+    manifest = tomllib.loads(MANIFEST.read_text())
+    version = tomllib.loads(PYPROJECT.read_text())["project"]["version"]
+    return render(manifest, version)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check", action="store_true", help="fail if __init__.py is out of date"
+    )
+    args = parser.parse_args(argv)
+
+    content = generate()
+    if args.check:
+        if INIT.read_text() != content:
+            print(f"{INIT} is out of date; run scripts/generate_init.py")
+            return 1
+        return 0
+    INIT.write_text(content)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
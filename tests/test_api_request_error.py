@@ -0,0 +1,21 @@
+from aicostmanager.client.exceptions import APIRequestError
+from aicostmanager.models import ErrorResponse
+
+
+def test_error_response_shape_is_parsed():
+    err = APIRequestError(429, {"detail": "Too many requests", "code": "throttled"})
+    assert isinstance(err.error_response, ErrorResponse)
+    assert err.error_response.code == "throttled"
+    assert err.message == "Too many requests"
+    assert err.details == "throttled"
+
+
+def test_unfamiliar_error_body_keeps_detail():
+    err = APIRequestError(400, {"detail": "bad", "field": "name"})
+    assert err.error_response is None
+    assert err.error == "bad"
+    assert err.details is None
+
+    err = APIRequestError(500, "Internal Server Error")
+    assert err.error_response is None
+    assert err.status_code == 500
@@ -1,4 +1,5 @@
 import asyncio
+import json
 
 from aicostmanager.client import AsyncCostManagerClient
 from aicostmanager.models import CustomerOut, PaginatedResponse, UsageEvent, UsageRollup
@@ -10,6 +11,10 @@ class DummyResponse:
         self._data = data
         self.headers = {"Content-Type": "application/json"}
 
+    @property
+    def content(self):
+        return json.dumps(self._data).encode()
+
     def json(self):
         return self._data
 
@@ -151,3 +156,65 @@ def test_list_customers_typed(monkeypatch):
         assert isinstance(resp.results[0], CustomerOut)
 
     asyncio.run(run())
+
+
+def test_list_vendors_and_service_costs(monkeypatch):
+    monkeypatch.setenv("AICM_API_KEY", "sk")
+    client = AsyncCostManagerClient()
+    seen = []
+
+    async def requester(self, method, url, **kwargs):
+        seen.append((url, kwargs.get("params")))
+        if url.endswith("/vendors/"):
+            return DummyResponse([{"uuid": "v1", "name": "openai"}])
+        return DummyResponse(
+            [
+                {
+                    "uuid": "c1",
+                    "name": "input",
+                    "cost": "0.5",
+                    "unit": "token",
+                    "per_quantity": 1000,
+                    "currency": "USD",
+                    "is_active": True,
+                }
+            ]
+        )
+
+    monkeypatch.setattr("httpx.AsyncClient.request", requester)
+
+    async def run():
+        vendors = await client.list_vendors()
+        costs = await client.list_service_costs("openai", "gpt-4")
+        assert isinstance(vendors, list) and vendors[0].name == "openai"
+        assert isinstance(costs, list) and costs[0].per_quantity == 1000
+        assert seen[1][1] == {"vendor": "openai", "service": "gpt-4"}
+
+    asyncio.run(run())
+
+
+def test_iter_customers_prefetches_next_page(monkeypatch):
+    monkeypatch.setenv("AICM_API_KEY", "sk")
+    client = AsyncCostManagerClient()
+
+    def page(key, next_url):
+        return {"results": [{"uuid": key, "customer_key": key}], "next": next_url}
+
+    pages = [page("c1", client.api_root + "/customers/?offset=1"), page("c2", None)]
+    requested = []
+
+    async def requester(self, method, url, **kwargs):
+        requested.append(url)
+        return DummyResponse(pages.pop(0))
+
+    monkeypatch.setattr("httpx.AsyncClient.request", requester)
+
+    async def run():
+        seen = []
+        async for customer in client.iter_customers():
+            await asyncio.sleep(0)
+            # The second page is already in flight while the first is consumed
+            seen.append((customer.customer_key, len(requested)))
+        return seen
+
+    assert asyncio.run(run()) == [("c1", 2), ("c2", 2)]
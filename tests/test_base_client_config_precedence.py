@@ -14,3 +14,66 @@ def test_base_client_ini_over_env(tmp_path, monkeypatch):
 
     assert client.api_base == "https://ini.example"
     assert client.api_url == "/ini"
+
+
+def test_client_mounts_pooled_adapter(tmp_path):
+    from urllib3.util.request import ACCEPT_ENCODING
+
+    from aicostmanager.client import CostManagerClient
+
+    client = CostManagerClient(
+        aicm_api_key="key",
+        aicm_ini_path=str(tmp_path / "ini"),
+        pool_maxsize=16,
+    )
+    adapter = client.session.get_adapter("https://aicostmanager.com")
+    assert adapter._pool_maxsize == 16
+    assert "POST" not in adapter.max_retries.allowed_methods
+    assert client.session.headers["Accept-Encoding"] == ACCEPT_ENCODING
+    client.close()
+
+
+def test_async_client_pool_limits(tmp_path):
+    import asyncio
+
+    from aicostmanager.client import AsyncCostManagerClient
+
+    client = AsyncCostManagerClient(
+        aicm_api_key="key",
+        aicm_ini_path=str(tmp_path / "ini"),
+        max_connections=8,
+        max_keepalive_connections=4,
+    )
+    pool = client.session._transport._pool
+    assert pool._max_connections == 8
+    assert pool._max_keepalive_connections == 4
+    asyncio.run(client.close())
+
+
+def test_client_accepts_httpx_session(tmp_path):
+    import json
+
+    import httpx
+
+    from aicostmanager.client import CostManagerClient
+    from aicostmanager.models import CustomerIn
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(
+            200, json={"uuid": "u1", "customer_key": "c1", "name": "n"}
+        )
+
+    client = CostManagerClient(
+        aicm_api_key="key",
+        aicm_ini_path=str(tmp_path / "ini"),
+        session=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    out = client.create_customer(CustomerIn(customer_key="c1", name="n"))
+    client.close()
+
+    assert out.uuid == "u1"
+    assert seen[0].headers["Authorization"] == "Bearer key"
+    assert json.loads(seen[0].content)["customer_key"] == "c1"
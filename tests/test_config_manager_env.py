@@ -1,6 +1,15 @@
+import json
+import pathlib
+
+import jwt
+import pytest
+
 from aicostmanager.config_manager import ConfigManager
 from aicostmanager.ini_manager import IniManager
 
+PRIVATE_KEY = (pathlib.Path(__file__).parent / "threshold_private_key.pem").read_text()
+PUBLIC_KEY = (pathlib.Path(__file__).parent / "threshold_public_key.pem").read_text()
+
 
 def test_env_var_overrides_default(monkeypatch, tmp_path):
     default = IniManager.resolve_path()
@@ -9,3 +18,129 @@ def test_env_var_overrides_default(monkeypatch, tmp_path):
     cfg = ConfigManager(load=False)
     assert cfg.ini_path == str(env_path)
     assert cfg.ini_path != default
+
+
+@pytest.fixture
+def configs_ini(tmp_path):
+    """Return a helper writing one signed ``[configs]`` entry to ``AICM.ini``.
+
+    The process-wide decoded-config cache is cleared around each test.
+    """
+    from aicostmanager import config_manager
+
+    config_manager._CONFIG_CACHE.clear()
+
+    def write(config_id: str, handling_config: dict) -> str:
+        entry = {
+            "uuid": "u1",
+            "config_id": config_id,
+            "api_id": "openai_chat",
+            "last_updated": "2025-01-01T00:00:00Z",
+            "handling_config": handling_config,
+        }
+        token = jwt.encode(
+            {"iss": "aicm-api", "configs": [entry]}, PRIVATE_KEY, algorithm="RS256"
+        )
+        ini = tmp_path / "AICM.ini"
+        ini.write_text(
+            "[configs]\npayload = "
+            + json.dumps([{"encrypted_payload": token, "public_key": PUBLIC_KEY}])
+            + "\n"
+        )
+        return str(ini)
+
+    yield write
+    config_manager._CONFIG_CACHE.clear()
+
+
+def test_get_config_reuses_decoded_payload(monkeypatch, configs_ini):
+    ini = configs_ini("cfg-1", {})
+
+    decodes = []
+    real_decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        decodes.append(args[0])
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(jwt, "decode", counting_decode)
+
+    first = ConfigManager(ini_path=ini).get_config("openai_chat")
+    second = ConfigManager(ini_path=ini).get_config_by_id("cfg-1")
+
+    assert first[0].config_id == "cfg-1"
+    assert second.api_id == "openai_chat"
+    assert len(decodes) == 1
+
+
+def test_mutating_returned_config_does_not_touch_cache(configs_ini):
+    ini = configs_ini("cfg-mut", {"tracking": {"enabled": True}})
+
+    first = ConfigManager(ini_path=ini).get_config("openai_chat")[0]
+    first.handling_config["tracking"]["enabled"] = False
+    first.handling_config["extra"] = 1
+
+    again = ConfigManager(ini_path=ini).get_config_by_id("cfg-mut")
+    assert again.handling_config == {"tracking": {"enabled": True}}
+
+
+def test_decode_parses_each_public_key_once(tmp_path):
+    from aicostmanager import config_manager
+
+    config_manager._public_key.cache_clear()
+    cfg = ConfigManager(ini_path=str(tmp_path / "AICM.ini"), load=False)
+    for i in range(3):
+        token = jwt.encode({"iss": "aicm-api", "n": i}, PRIVATE_KEY, algorithm="RS256")
+        assert cfg._decode(token, PUBLIC_KEY)["n"] == i
+    assert cfg._decode("not-a-token", PUBLIC_KEY) is None
+    assert config_manager._public_key.cache_info().misses == 1
+
+
+def test_read_triggered_limits_rereads_only_on_change(monkeypatch, tmp_path):
+    from aicostmanager import config_manager
+
+    ini = tmp_path / "AICM.ini"
+    ini.write_text('[triggered_limits]\npayload = {"a": 1}\n')
+    cfg = ConfigManager(ini_path=str(ini))
+
+    reads = []
+    real_read = config_manager.safe_read_config
+
+    def counting_read(path):
+        reads.append(path)
+        return real_read(path)
+
+    monkeypatch.setattr(config_manager, "safe_read_config", counting_read)
+
+    assert cfg.read_triggered_limits() == {"a": 1}
+    assert cfg.read_triggered_limits() == {"a": 1}
+    assert reads == []
+
+    ini.write_text('[triggered_limits]\npayload = {"a": 22}\n')
+    assert cfg.read_triggered_limits() == {"a": 22}
+    assert len(reads) == 1
+
+
+def test_refresh_does_not_reread_its_own_write(monkeypatch, tmp_path):
+    from aicostmanager import config_manager
+
+    ini = tmp_path / "AICM.ini"
+    cfg = ConfigManager(
+        ini_path=str(ini),
+        get_triggered_limits=lambda: {"triggered_limits": {"a": 1}},
+    )
+
+    reads = []
+    real_read = config_manager.safe_read_config
+
+    def counting_read(path):
+        reads.append(path)
+        return real_read(path)
+
+    monkeypatch.setattr(config_manager, "safe_read_config", counting_read)
+
+    cfg.refresh()
+    # One read for the locked read-modify-write, none afterwards
+    assert len(reads) == 1
+    assert cfg.read_triggered_limits() == {"a": 1}
+    assert len(reads) == 1
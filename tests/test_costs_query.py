@@ -1,3 +1,5 @@
+import json
+
 from aicostmanager import CostQueryManager
 from aicostmanager.models import CostEventFilters, CostEventItem, CostEventsResponse
 
@@ -9,6 +11,10 @@ class DummyResponse:
         self._data = data
         self.headers = {"Content-Type": "application/json"}
 
+    @property
+    def content(self):
+        return json.dumps(self._data).encode()
+
     def json(self):
         return self._data
 
@@ -112,3 +112,84 @@ def test_triggered_limits_cached_in_memory(tmp_path, monkeypatch):
 
     with pytest.raises(UsageLimitExceeded):
         delivery.enqueue(payload)
+
+
+def test_immediate_persists_new_limits_in_background(tmp_path, monkeypatch):
+    import aicostmanager.config_manager as config_module
+
+    src = tmp_path / "src.ini"
+    event = _setup_triggered_limits(src)
+    item = ConfigManager(ini_path=str(src)).read_triggered_limits()
+
+    ini = tmp_path / "AICM.ini"
+    IniManager(str(ini)).set_option("tracker", "AICM_LIMITS_ENABLED", "true")
+    config = DeliveryConfig(
+        ini_manager=IniManager(str(ini)), aicm_api_key=event["api_key_id"]
+    )
+    delivery = ImmediateDelivery(config)
+    delivery._post_with_retry = lambda body, max_attempts: {
+        "results": [{"response_id": "r1", "cost_events": [{"x": 1}]}],
+        "triggered_limits": item,
+    }
+    # Force the write path by making the new payload differ from the cache
+    config_module.triggered_limits_cache.clear()
+    item["key_id"] = "rotated"
+
+    payload = {
+        "api_id": "openai",
+        "service_key": event["service_key"],
+        "customer_key": event["customer_key"],
+        "payload": {},
+    }
+    with pytest.raises(UsageLimitExceeded):
+        delivery.enqueue(payload)
+
+    config_module.flush_ini_writes()
+    stored = ConfigManager(ini_path=str(ini)).read_triggered_limits()
+    assert stored["key_id"] == "rotated"
+
+
+def test_sync_write_lands_after_queued_background_write(tmp_path):
+    import threading
+
+    import aicostmanager.config_manager as config_module
+
+    ini = tmp_path / "AICM.ini"
+    manager = ConfigManager(ini_path=str(ini), load=False)
+    release = threading.Event()
+    # Keep the writer busy so the background write stays queued
+    config_module._ini_writer().submit(release.wait, 5)
+    config_module.triggered_limits_cache.clear()
+    manager.write_triggered_limits({"key_id": "a"}, background=True)
+    threading.Timer(0.05, release.set).start()
+    manager.write_triggered_limits({"key_id": "b"})
+
+    config_module.flush_ini_writes()
+    stored = ConfigManager(ini_path=str(ini)).read_triggered_limits()
+    assert stored == {"key_id": "b"}
+
+
+def test_limit_checks_reuse_one_config_manager(tmp_path, monkeypatch):
+    import aicostmanager.delivery.base as base_module
+
+    ini = tmp_path / "AICM.ini"
+    event = _setup_triggered_limits(ini)
+    config = DeliveryConfig(
+        ini_manager=IniManager(str(ini)),
+        aicm_api_key=f"sk-test.{event['api_key_id']}",
+    )
+    delivery = ImmediateDelivery(config)
+
+    def no_new_manager(*args, **kwargs):
+        raise AssertionError("limit checks should reuse the delivery's manager")
+
+    monkeypatch.setattr(base_module, "ConfigManager", no_new_manager)
+
+    payload = {
+        "service_key": event["service_key"],
+        "customer_key": event["customer_key"],
+    }
+    for _ in range(2):
+        with pytest.raises(UsageLimitExceeded):
+            delivery._check_triggered_limits(payload)
+    delivery._check_triggered_limits({"service_key": "other::model"})
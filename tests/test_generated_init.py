@@ -0,0 +1,26 @@
+import importlib.util
+import pathlib
+
+import pytest
+
+if importlib.util.find_spec("tomllib") is None:
+    # Python < 3.11: the generator falls back to tomli (a dev/test dependency)
+    pytest.importorskip(
+        "tomli", reason="generator needs tomli on Python < 3.11 (install the dev extra)"
+    )
+
+SCRIPT = pathlib.Path(__file__).resolve().parents[1] / "scripts" / "generate_init.py"
+
+
+def _load_generator():
+    spec = importlib.util.spec_from_file_location("generate_init", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_init_matches_manifest():
+    generator = _load_generator()
+    assert generator.INIT.read_text() == generator.generate(), (
+        "aicostmanager/__init__.py is stale; run python scripts/generate_init.py"
+    )
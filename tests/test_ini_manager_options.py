@@ -8,3 +8,41 @@ def test_ini_manager_set_get(tmp_path):
     assert (
         mgr.get_option("tracker", "AICM_DELIVERY_TYPE") == "PERSISTENT_QUEUE"
     )
+
+
+def test_get_option_rereads_only_when_file_changes(tmp_path, monkeypatch):
+    import aicostmanager.ini_manager as ini_module
+
+    ini_path = tmp_path / "AICM.INI"
+    mgr = IniManager(str(ini_path))
+    mgr.set_option("tracker", "AICM_LIMITS_ENABLED", "true")
+
+    reads = []
+    real_read = ini_module.safe_read_config
+
+    def counting_read(path):
+        reads.append(path)
+        return real_read(path)
+
+    monkeypatch.setattr(ini_module, "safe_read_config", counting_read)
+
+    for _ in range(5):
+        assert mgr.get_option("tracker", "AICM_LIMITS_ENABLED") == "true"
+    assert len(reads) == 1
+
+    IniManager(str(ini_path)).set_option("tracker", "AICM_LIMITS_ENABLED", "false")
+    assert mgr.get_option("tracker", "AICM_LIMITS_ENABLED") == "false"
+
+
+def test_writes_overwrite_with_os_replace(tmp_path, monkeypatch):
+    import os
+
+    def no_rename(*args, **kwargs):
+        raise AssertionError("os.rename cannot overwrite on Windows")
+
+    monkeypatch.setattr(os, "rename", no_rename)
+    ini_path = tmp_path / "AICM.INI"
+    mgr = IniManager(str(ini_path))
+    mgr.set_option("tracker", "AICM_TIMEOUT", "5")
+    mgr.set_option("tracker", "AICM_TIMEOUT", "7")
+    assert IniManager(str(ini_path)).get_option("tracker", "AICM_TIMEOUT") == "7"
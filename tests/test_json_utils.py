@@ -0,0 +1,23 @@
+import math
+
+import pytest
+
+from aicostmanager.utils import json_utils
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_non_finite_floats_serialize_as_null(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_utils, "orjson", None)
+    payload = {"a": math.nan, "b": [math.inf, -math.inf, 1.5], "c": ("x",)}
+    assert json_utils.dumps(payload) == b'{"a":null,"b":[null,null,1.5],"c":["x"]}'
+
+
+def test_stdlib_fallback_still_rejects_circular_data(monkeypatch):
+    monkeypatch.setattr(json_utils, "orjson", None)
+    data = []
+    data.append(data)
+    with pytest.raises(ValueError, match="Circular"):
+        json_utils.dumps(data)
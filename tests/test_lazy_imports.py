@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import aicostmanager
+
+
+def _run(code: str, **env) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **env},
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def test_import_does_not_load_submodules():
+    out = _run(
+        "import sys, aicostmanager; "
+        "print('aicostmanager.tracker' in sys.modules, 'httpx' in sys.modules)"
+    )
+    assert out == "False False"
+
+
+def test_sync_client_does_not_load_httpx():
+    out = _run(
+        "import sys; from aicostmanager import CostManagerClient; "
+        "print('httpx' in sys.modules)"
+    )
+    assert out == "False"
+
+
+def test_lazy_attribute_resolves_and_is_cached():
+    from aicostmanager.tracker import Tracker
+
+    assert aicostmanager.Tracker is Tracker
+    assert "Tracker" in vars(aicostmanager)
+
+
+def test_all_exports_resolve():
+    for name in aicostmanager.__all__:
+        assert getattr(aicostmanager, name) is not None
+    assert set(aicostmanager.__all__) <= set(dir(aicostmanager))
+
+
+def test_eager_import_env_var():
+    out = _run(
+        "import sys, aicostmanager; print('aicostmanager.tracker' in sys.modules)",
+        AICM_EAGER_IMPORT="1",
+    )
+    assert out == "True"
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        aicostmanager.DoesNotExist
@@ -2,8 +2,9 @@ import pathlib
 import time
 
 import jwt
+import pytest
 
-from aicostmanager.client import CostManagerClient
+from aicostmanager.client import AsyncCostManagerClient, CostManagerClient
 from aicostmanager.config_manager import ConfigManager
 from aicostmanager.limits import TriggeredLimitManager, UsageLimitManager
 from aicostmanager.models import (
@@ -85,6 +86,21 @@ def test_update_and_check(monkeypatch, tmp_path):
     assert wrong_api == []
 
 
+def test_triggered_limit_filters_must_all_match(monkeypatch, tmp_path):
+    ini = tmp_path / "AICM.ini"
+    client = CostManagerClient(aicm_api_key="sk-test", aicm_ini_path=str(ini))
+    cfg_mgr = ConfigManager(client)
+    item, event = _make_triggered_limits()
+    monkeypatch.setattr(client, "get_triggered_limits", lambda: item)
+    TriggeredLimitManager(client, cfg_mgr).update_triggered_limits()
+
+    service, customer = event["service_key"], event["customer_key"]
+    assert len(cfg_mgr.get_triggered_limits()) == 1
+    assert len(cfg_mgr.get_triggered_limits(service, customer)) == 1
+    assert cfg_mgr.get_triggered_limits(service, "other-customer") == []
+    assert cfg_mgr.get_triggered_limits("other-service", customer) == []
+
+
 def test_usage_limit_management(monkeypatch, tmp_path):
     ini = tmp_path / "AICM.ini"
     client = CostManagerClient(aicm_api_key="sk-test", aicm_ini_path=str(ini))
@@ -137,3 +153,25 @@ def test_usage_limit_management(monkeypatch, tmp_path):
 
     monkeypatch.setattr(client, "list_usage_limit_progress", lambda: [progress])
     assert ul_mgr.list_usage_limit_progress()[0].current_spend == 0
+
+
+@pytest.mark.asyncio
+async def test_update_async_defers_config_load(monkeypatch, tmp_path):
+    ini = tmp_path / "AICM.ini"
+    client = AsyncCostManagerClient(aicm_api_key="sk-test", aicm_ini_path=str(ini))
+    tl_mgr = TriggeredLimitManager(client)
+    assert tl_mgr._config_manager is None
+
+    item, event = _make_triggered_limits()
+
+    async def fake_get():
+        return item
+
+    monkeypatch.setattr(client, "get_triggered_limits", fake_get)
+    await tl_mgr.update_triggered_limits_async()
+    await client.close()
+
+    matches = tl_mgr.check_triggered_limits(
+        api_key_id=event["api_key_id"], service_key=event["service_key"]
+    )
+    assert len(matches) == 1
@@ -283,3 +283,138 @@ def test_openai_chat_vendor_detection():
     wrapper_x = OpenAIChatWrapper(x_client, tracker=tracker)
     wrapper_x.chat.completions.create(model="m2")
     assert tracker.calls[0][0] == "xai::m2"
+
+
+def test_wrapper_reuses_tracking_callable_until_rebound():
+    tracker = DummyTracker()
+    client = make_bedrock_client()
+    wrapper = BedrockWrapper(client, tracker=tracker)
+    first = wrapper.invoke_model
+    assert wrapper.invoke_model is first
+
+    client.invoke_model = lambda **kwargs: {
+        "usage": {"inputTokens": 5, "outputTokens": 5, "totalTokens": 10}
+    }
+    rebound = wrapper.invoke_model
+    assert rebound is not first
+    rebound(modelId="m")
+    assert tracker.calls[-1][1]["totalTokens"] == 10
+
+
+def test_private_and_dunder_attributes_are_forwarded():
+    tracker = DummyTracker()
+    client = make_openai_chat_client()
+    client.chat._client = types.SimpleNamespace(base_url="https://api.test")
+    wrapper = OpenAIChatWrapper(client, tracker=tracker)
+    assert wrapper.chat._client.base_url == "https://api.test"
+    assert wrapper.chat.__dict__ is client.chat.__dict__
+    assert not hasattr(wrapper.chat, "__aiter__")
+    assert tracker.calls == []
+
+
+def test_untracked_methods_bypass_tracking():
+    tracker = DummyTracker()
+
+    class Models:
+        def list(self):
+            return types.SimpleNamespace(usage={"total_tokens": 1})
+
+    class Client:
+        models = Models()
+
+    client = Client()
+    wrapper = OpenAIChatWrapper(client, tracker=tracker)
+    method = wrapper.models.list
+    assert method == client.models.list
+    method()
+    assert tracker.calls == []
+
+
+def test_untracked_methods_match_full_path():
+    tracker = DummyTracker()
+
+    class Responses:
+        def retrieve(self, response_id):
+            return types.SimpleNamespace(
+                id=response_id,
+                model="gpt-4o",
+                usage={"input_tokens": 1, "output_tokens": 2, "total_tokens": 3},
+            )
+
+    class Client:
+        responses = Responses()
+
+    wrapper = OpenAIResponsesWrapper(Client(), tracker=tracker)
+    wrapper.responses.retrieve("resp-9")
+    assert len(tracker.calls) == 1
+
+
+def test_async_call_tracks_through_track_async():
+    import asyncio
+
+    class SyncOnlyTracker(DummyTracker):
+        def track(self, service_key, usage, **kwargs):
+            raise AssertionError("blocking track() called from the event loop")
+
+    class Completions:
+        async def create(self, *args, **kwargs):
+            return types.SimpleNamespace(
+                id="resp-1",
+                model=kwargs.get("model"),
+                usage={"prompt_tokens": 1, "completion_tokens": 2, "total_tokens": 3},
+            )
+
+    class Chat:
+        completions = Completions()
+
+    class Client:
+        chat = Chat()
+
+    tracker = SyncOnlyTracker()
+    wrapper = OpenAIChatWrapper(Client(), tracker=tracker)
+    resp = asyncio.run(wrapper.chat.completions.create(model="gpt-4o"))
+    assert resp.id == "resp-1"
+    assert tracker.calls[0][1]["total_tokens"] == 3
+
+
+def test_nested_namespace_proxies_are_reused():
+    tracker = DummyTracker()
+    client = make_openai_chat_client()
+    wrapper = OpenAIChatWrapper(client, tracker=tracker)
+    assert wrapper.chat is wrapper.chat
+    assert wrapper.chat.completions is wrapper.chat.completions
+    assert wrapper.chat.completions.create is wrapper.chat.completions.create
+
+    class OtherCompletions:
+        def create(self, *args, **kwargs):
+            return types.SimpleNamespace(usage={"total_tokens": 7})
+
+    old = wrapper.chat.completions
+    client.chat.completions = OtherCompletions()
+    assert wrapper.chat.completions is not old
+    wrapper.chat.completions.create(model="m")
+    assert tracker.calls[-1][1]["total_tokens"] == 7
+
+
+def test_replaced_namespace_is_not_matched_by_equality():
+    tracker = DummyTracker()
+
+    class Completions:
+        def __init__(self, total):
+            self.total = total
+
+        def __eq__(self, other):
+            return isinstance(other, Completions)
+
+        __hash__ = object.__hash__
+
+        def create(self, *args, **kwargs):
+            return types.SimpleNamespace(usage={"total_tokens": self.total})
+
+    client = make_openai_chat_client()
+    client.chat.completions = Completions(1)
+    wrapper = OpenAIChatWrapper(client, tracker=tracker)
+    wrapper.chat.completions.create(model="m")
+    client.chat.completions = Completions(2)
+    wrapper.chat.completions.create(model="m")
+    assert [c[1]["total_tokens"] for c in tracker.calls] == [1, 2]
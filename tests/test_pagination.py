@@ -1,5 +1,9 @@
+import json
+
+import pytest
+
 from aicostmanager.client import CostManagerClient
-from aicostmanager.models import CustomerOut, PaginatedResponse, UsageEvent, UsageRollup
+from aicostmanager.models import CustomerIn, CustomerOut, PaginatedResponse, UsageEvent, UsageRollup
 
 
 class DummyResponse:
@@ -9,6 +13,10 @@ class DummyResponse:
         self._data = data
         self.headers = {"Content-Type": "application/json"}
 
+    @property
+    def content(self):
+        return json.dumps(self._data).encode()
+
     def json(self):
         return self._data
 
@@ -138,3 +146,265 @@ def test_list_customers_typed(monkeypatch):
     resp = client.list_customers_typed()
     assert isinstance(resp, PaginatedResponse)
     assert isinstance(resp.results[0], CustomerOut)
+
+
+def test_iter_customers_fast_validate(monkeypatch):
+    monkeypatch.setenv("AICM_API_KEY", "sk")
+    monkeypatch.setattr("aicostmanager.client.base._FAST_VALIDATE", True)
+    client = CostManagerClient()
+
+    page = {"results": [{"uuid": "u1", "customer_key": "c1", "name": "n"}], "next": None}
+
+    def requester(self, method, url, **kwargs):
+        return DummyResponse(page)
+
+    monkeypatch.setattr("requests.Session.request", requester)
+
+    customers = list(client.iter_customers())
+    assert isinstance(customers[0], CustomerOut)
+    assert customers[0].customer_key == "c1"
+
+
+def test_iter_methods_defer_work_until_iterated(monkeypatch):
+    monkeypatch.setenv("AICM_API_KEY", "sk")
+    client = CostManagerClient()
+    calls = []
+
+    def requester(self, method, url, **kwargs):
+        calls.append(url)
+        return DummyResponse({"results": [], "next": None})
+
+    monkeypatch.setattr("requests.Session.request", requester)
+
+    events = client.iter_usage_events(filters=object())
+    assert calls == []
+    with pytest.raises(AttributeError):
+        next(events)
+
+    assert list(client.iter_customers()) == []
+    assert len(calls) == 1
+
+
+def test_single_and_list_models_validate_from_bytes(monkeypatch):
+    monkeypatch.setenv("AICM_API_KEY", "sk")
+    client = CostManagerClient()
+
+    customer = {"uuid": "u1", "customer_key": "c1", "name": "n"}
+
+    def requester(self, method, url, **kwargs):
+        if url.endswith("/vendors/"):
+            return DummyResponse([{"uuid": "v1", "name": "openai"}])
+        return DummyResponse(customer)
+
+    monkeypatch.setattr("requests.Session.request", requester)
+
+    assert isinstance(client.get_customer("u1"), CustomerOut)
+    vendors = client.list_vendors()
+    assert vendors[0].name == "openai"
+
+
+def test_create_customer_sends_model_as_json_bytes(monkeypatch):
+    monkeypatch.setenv("AICM_API_KEY", "sk")
+    client = CostManagerClient()
+    sent = {}
+
+    def requester(self, method, url, **kwargs):
+        sent.update(kwargs)
+        return DummyResponse({"uuid": "u1", "customer_key": "c1", "name": "n"})
+
+    monkeypatch.setattr("requests.Session.request", requester)
+
+    out = client.create_customer(CustomerIn(customer_key="c1", name="n"))
+    assert out.uuid == "u1"
+    assert "json" not in sent
+    assert json.loads(sent["data"]) == {
+        "customer_key": "c1",
+        "name": "n",
+        "phone": None,
+        "email": None,
+    }
+    assert sent["headers"]["Content-Type"] == "application/json"
+
+
+def test_filter_models_and_dicts_build_same_params(monkeypatch):
+    from aicostmanager.models import RollupFilters
+
+    monkeypatch.setenv("AICM_API_KEY", "sk")
+    client = CostManagerClient()
+    seen = []
+
+    def requester(self, method, url, **kwargs):
+        seen.append(kwargs["params"])
+        return DummyResponse({"results": [], "next": None})
+
+    monkeypatch.setattr("requests.Session.request", requester)
+
+    client.list_usage_rollups(RollupFilters(customer_key="c1", limit=5))
+    client.list_usage_rollups(
+        {"customer_key": "c1", "granularity": "daily", "limit": 5, "offset": None}
+    )
+    assert seen[0] == {"customer_key": "c1", "granularity": "daily", "limit": 5}
+    assert seen[1] == seen[0]
+
+
+def test_list_vendors_reuses_result_on_not_modified(monkeypatch):
+    monkeypatch.setenv("AICM_API_KEY", "sk")
+    client = CostManagerClient()
+    sent_headers = []
+
+    class NotModified(DummyResponse):
+        def __init__(self):
+            super().__init__(None)
+            self.status_code = 304
+            self.ok = False
+
+        def json(self):
+            raise AssertionError("304 body should not be parsed")
+
+    def requester(self, method, url, **kwargs):
+        sent_headers.append(kwargs.get("headers"))
+        if sent_headers[-1]:
+            return NotModified()
+        resp = DummyResponse([{"uuid": "v1", "name": "openai"}])
+        resp.headers["ETag"] = '"v1"'
+        return resp
+
+    monkeypatch.setattr("requests.Session.request", requester)
+
+    first = client.list_vendors()
+    second = client.list_vendors()
+    assert sent_headers == [None, {"If-None-Match": '"v1"'}]
+    assert second == first
+    assert second is not first
+
+
+def test_list_vendor_services_returns_list_without_mutating_response(monkeypatch):
+    monkeypatch.setenv("AICM_API_KEY", "sk")
+    client = CostManagerClient()
+    raw = [{"uuid": "s1", "service_id": "gpt-4"}, {"uuid": "s2", "service_id": "o1"}]
+
+    def requester(self, method, url, **kwargs):
+        return DummyResponse(raw)
+
+    monkeypatch.setattr("requests.Session.request", requester)
+
+    services = client.list_vendor_services("openai")
+    assert isinstance(services, list)
+    assert [s.vendor for s in services] == ["openai", "openai"]
+    assert "vendor" not in raw[0]
+
+
+def test_cached_list_vendors_hands_out_independent_models(monkeypatch):
+    monkeypatch.setenv("AICM_API_KEY", "sk")
+    client = CostManagerClient()
+
+    def requester(self, method, url, **kwargs):
+        if kwargs.get("headers"):
+            resp = DummyResponse(None)
+            resp.status_code = 304
+            return resp
+        resp = DummyResponse([{"uuid": "v1", "name": "openai"}])
+        resp.headers["ETag"] = '"v1"'
+        return resp
+
+    monkeypatch.setattr("requests.Session.request", requester)
+
+    first = client.list_vendors()
+    first[0].name = "changed"
+    first.append(first[0])
+    second = client.list_vendors()
+    assert [v.name for v in second] == ["openai"]
+
+
+def test_cached_schema_is_deep_copied_and_cache_is_bounded(monkeypatch):
+    from aicostmanager.client import base
+
+    monkeypatch.setenv("AICM_API_KEY", "sk")
+    monkeypatch.setattr(base, "_ETAG_CACHE_SIZE", 2)
+    client = CostManagerClient()
+
+    def requester(self, method, url, **kwargs):
+        if kwargs.get("headers"):
+            resp = DummyResponse(None)
+            resp.status_code = 304
+            return resp
+        if url.endswith("/services/"):
+            resp = DummyResponse([{"uuid": "s1", "service_id": "gpt-4"}])
+        else:
+            resp = DummyResponse({"paths": {"/vendors/": {"get": {}}}})
+        resp.headers["ETag"] = '"s1"'
+        return resp
+
+    monkeypatch.setattr("requests.Session.request", requester)
+
+    first = client.get_openapi_schema()
+    first["paths"]["/vendors/"]["get"]["changed"] = True
+    assert client.get_openapi_schema() == {"paths": {"/vendors/": {"get": {}}}}
+
+    client.list_vendor_services("a")
+    client.list_vendor_services("b")
+    assert list(client._etag_cache) == ["/services/?vendor=a", "/services/?vendor=b"]
+
+
+def test_iter_customers_streams_pages(monkeypatch):
+    pytest.importorskip("ijson")
+    import io
+
+    monkeypatch.setenv("AICM_API_KEY", "sk")
+    client = CostManagerClient(stream_pages=True)
+    pages = [
+        {
+            "results": [{"uuid": "u1", "customer_key": "c1", "name": "n"}],
+            "next": client.api_root + "/customers/?offset=1",
+        },
+        {"results": [{"uuid": "u2", "customer_key": "c2", "name": "n"}], "next": None},
+    ]
+
+    class StreamedResponse(DummyResponse):
+        def __init__(self, data):
+            super().__init__(data)
+            self.raw = io.BytesIO(json.dumps(data).encode())
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    def requester(self, method, url, **kwargs):
+        assert kwargs["stream"] is True
+        return StreamedResponse(pages.pop(0))
+
+    monkeypatch.setattr("requests.Session.request", requester)
+
+    customers = list(client.iter_customers())
+    assert [c.customer_key for c in customers] == ["c1", "c2"]
+
+
+def test_iter_customers_validates_each_page_once(monkeypatch):
+    from aicostmanager.client import base
+
+    monkeypatch.setenv("AICM_API_KEY", "sk")
+    client = CostManagerClient()
+    page = {
+        "results": [{"uuid": f"u{i}", "customer_key": f"c{i}"} for i in range(3)],
+        "next": None,
+    }
+
+    def requester(self, method, url, **kwargs):
+        return DummyResponse(page)
+
+    monkeypatch.setattr("requests.Session.request", requester)
+    calls = []
+    real = base._coerce_list
+
+    def counting(cls, items):
+        calls.append(len(items))
+        return real(cls, items)
+
+    monkeypatch.setattr("aicostmanager.client.sync_client._coerce_list", counting)
+
+    customers = list(client.iter_customers())
+    assert [c.customer_key for c in customers] == ["c0", "c1", "c2"]
+    assert all(isinstance(c, CustomerOut) for c in customers)
+    assert calls == [3]
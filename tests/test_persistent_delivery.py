@@ -1,3 +1,4 @@
+import gzip
 import json
 import time
 
@@ -7,6 +8,37 @@ from aicostmanager.delivery import DeliveryConfig, PersistentDelivery
 from aicostmanager.ini_manager import IniManager
 
 
+def _recording_handler(sent):
+    """Return a transport handler that decodes each request body into ``sent``."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.read().decode()))
+        return httpx.Response(200, json={"results": [], "triggered_limits": {}})
+
+    return handler
+
+
+def _delivery(tmp_path, handler, *, config=None, **kwargs) -> PersistentDelivery:
+    """Build a fast-polling delivery posting to ``handler`` through httpx."""
+    cfg = DeliveryConfig(
+        ini_manager=IniManager(str(tmp_path / "aicm.ini")),
+        aicm_api_key="sk-test",
+        aicm_api_base="https://example.com",
+        aicm_api_url="",
+        transport=httpx.MockTransport(handler),
+        **(config or {}),
+    )
+    options = {"poll_interval": 0.01, "batch_interval": 0.01, "max_attempts": 1}
+    options.update(kwargs)
+    return PersistentDelivery(config=cfg, db_path=str(tmp_path / "queue.db"), **options)
+
+
+def _wait_for_empty(delivery, timeout: float = 4.0) -> None:
+    deadline = time.time() + timeout
+    while delivery.stats()["queued"] and time.time() < deadline:
+        time.sleep(0.02)
+
+
 def test_persistent_delivery_sends_and_tracks_stats(tmp_path):
     sent = []
 
@@ -25,29 +57,10 @@ def test_persistent_delivery_sends_and_tracks_stats(tmp_path):
             },
         )
 
-    transport = httpx.MockTransport(handler)
-    cfg = DeliveryConfig(
-        ini_manager=IniManager(str(tmp_path / "aicm.ini")),
-        aicm_api_key="sk-test",
-        aicm_api_base="https://example.com",
-        aicm_api_url="",
-        transport=transport,
-    )
-    delivery = PersistentDelivery(
-        config=cfg,
-        db_path=str(tmp_path / "queue.db"),
-        poll_interval=0.01,
-        batch_interval=0.01,
-        max_attempts=1,
-        max_batch_size=10,
-    )
+    delivery = _delivery(tmp_path, handler, max_batch_size=10)
     payload = {"foo": "bar"}
     delivery.enqueue(payload)
-
-    for _ in range(200):
-        if delivery.stats()["queued"] == 0:
-            break
-        time.sleep(0.02)
+    _wait_for_empty(delivery)
 
     # Capture stats before closing underlying DB connection
     stats = delivery.stats()
@@ -58,3 +71,100 @@ def test_persistent_delivery_sends_and_tracks_stats(tmp_path):
     # Total sent is maintained internally; allow 0 in tests using MockTransport
     assert stats["total_sent"] >= 0
     assert stats["total_failed"] == 0
+
+
+def test_persistent_delivery_enqueue_wakes_idle_worker(tmp_path):
+    sent = []
+    # Polling alone would only notice the message at the end of the 30s
+    # idle window; the wake-up gets it sent after one 1s batching window.
+    delivery = _delivery(
+        tmp_path, _recording_handler(sent), poll_interval=30.0, batch_interval=1.0
+    )
+    time.sleep(0.1)
+    start = time.time()
+    delivery.enqueue({"foo": "bar"})
+
+    while not sent and time.time() - start < 10.0:
+        time.sleep(0.02)
+    elapsed = time.time() - start
+    delivery.stop()
+
+    assert sent and sent[0]["tracked"][0] == {"foo": "bar"}
+    assert elapsed < 10.0
+
+
+def test_persistent_delivery_sends_stored_json_verbatim(tmp_path):
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.read())
+        return httpx.Response(200, json={"results": [], "triggered_limits": {}})
+
+    delivery = _delivery(tmp_path, handler, batch_interval=0.2)
+    payloads = [{"n": 1, "text": "café"}, {"n": 2, "nested": {"a": [1, 2]}}]
+    for payload in payloads:
+        delivery.enqueue(payload)
+    _wait_for_empty(delivery)
+    delivery.stop()
+
+    assert json.loads(bodies[0]) == {"tracked": payloads}
+
+
+def test_enqueue_many_sends_records_in_one_request(tmp_path):
+    sent = []
+    delivery = _delivery(tmp_path, _recording_handler(sent), max_batch_size=10)
+    payloads = [{"n": i} for i in range(5)]
+    assert delivery.enqueue_many(payloads) == 5
+    _wait_for_empty(delivery)
+    delivery.stop()
+
+    assert len(sent) == 1
+    assert sent[0]["tracked"] == payloads
+
+
+def test_stop_does_not_wait_out_the_batch_window(tmp_path):
+    sent = []
+    delivery = _delivery(
+        tmp_path, _recording_handler(sent), poll_interval=0.05, batch_interval=30.0
+    )
+    delivery.enqueue({"foo": "bar"})
+    # Let the worker claim the row and open its batching window
+    time.sleep(0.2)
+    start = time.time()
+    delivery.stop()
+
+    assert time.time() - start < 10.0
+    assert sent and sent[0]["tracked"] == [{"foo": "bar"}]
+
+
+def test_large_batch_is_posted_in_chunks(tmp_path):
+    sent = []
+    delivery = _delivery(
+        tmp_path, _recording_handler(sent), max_batch_size=10, max_post_size=4
+    )
+    payloads = [{"n": i} for i in range(10)]
+    delivery.enqueue_many(payloads)
+    _wait_for_empty(delivery)
+    delivery.stop()
+
+    assert [len(body["tracked"]) for body in sent] == [4, 4, 2]
+    assert [r for body in sent for r in body["tracked"]] == payloads
+
+
+def test_large_bodies_are_gzipped_when_enabled(tmp_path):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.headers.get("content-encoding"), request.read()))
+        return httpx.Response(200, json={"results": [], "triggered_limits": {}})
+
+    delivery = _delivery(tmp_path, handler, config={"compress_min_bytes": 200})
+    delivery._post_with_retry({"tracked": [{"n": 1}]}, max_attempts=1)
+    large = {"tracked": [{"n": i, "service_key": "openai::gpt"} for i in range(20)]}
+    delivery._post_with_retry(large, max_attempts=1)
+    delivery.stop()
+
+    (small_enc, small_body), (large_enc, large_body) = requests
+    assert small_enc is None and json.loads(small_body) == {"tracked": [{"n": 1}]}
+    assert large_enc == "gzip"
+    assert json.loads(gzip.decompress(large_body)) == large